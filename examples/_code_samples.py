@@ -0,0 +1,281 @@
+"""
+Shared code snippets shown by the LLM example apps.
+
+The example tools build their UICode payloads from these constants at
+import time, so the snippet text lives in one place.
+"""
+
+PYTHON_FETCH_DATA = '''async def fetch_data(url: str) -> dict:
+    """Fetch JSON data asynchronously."""
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url) as response:
+            return await response.json()
+
+# Usage
+data = await fetch_data("https://api.example.com/data")
+print(f"Received {len(data)} items")'''
+
+GO_PROCESS_CONCURRENTLY = '''func ProcessConcurrently(items []string) []Result {
+    results := make(chan Result, len(items))
+
+    for _, item := range items {
+        go func(i string) {
+            results <- Process(i)
+        }(item)
+    }
+
+    output := make([]Result, len(items))
+    for i := range items {
+        output[i] = <-results
+    }
+    return output
+}'''
+
+PYTHON_USERS = '''import asyncio
+from dataclasses import dataclass
+
+@dataclass
+class User:
+    """User model with validation."""
+    name: str
+    email: str
+    age: int
+
+    def __post_init__(self):
+        if self.age < 0:
+            raise ValueError("Age must be positive")
+
+async def fetch_users() -> list[User]:
+    """Fetch users asynchronously."""
+    # Simulate API call
+    await asyncio.sleep(0.1)
+
+    return [
+        User("Alice", "alice@example.com", 28),
+        User("Bob", "bob@example.com", 35),
+    ]
+
+# Usage
+users = await fetch_users()
+for user in users:
+    print(f"{user.name}: {user.email}")'''
+
+GO_USERS = '''package main
+
+import (
+    "context"
+    "fmt"
+    "time"
+)
+
+type User struct {
+    Name  string
+    Email string
+    Age   int
+}
+
+func FetchUsers(ctx context.Context) ([]User, error) {
+    // Simulate API call with context
+    select {
+    case <-time.After(100 * time.Millisecond):
+        return []User{
+            {Name: "Alice", Email: "alice@example.com", Age: 28},
+            {Name: "Bob", Email: "bob@example.com", Age: 35},
+        }, nil
+    case <-ctx.Done():
+        return nil, ctx.Err()
+    }
+}
+
+func main() {
+    ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+    defer cancel()
+
+    users, err := FetchUsers(ctx)
+    if err != nil {
+        fmt.Printf("Error: %v\\n", err)
+        return
+    }
+
+    for _, user := range users {
+        fmt.Printf("%s: %s\\n", user.Name, user.Email)
+    }
+}'''
+
+TYPESCRIPT_USERS = '''interface User {
+  name: string;
+  email: string;
+  age: number;
+}
+
+async function fetchUsers(): Promise<User[]> {
+  // Simulate API call
+  await new Promise(resolve => setTimeout(resolve, 100));
+
+  return [
+    { name: "Alice", email: "alice@example.com", age: 28 },
+    { name: "Bob", email: "bob@example.com", age: 35 },
+  ];
+}
+
+// Usage with error handling
+try {
+  const users = await fetchUsers();
+  users.forEach(user => {
+    console.log(`${user.name}: ${user.email}`);
+  });
+} catch (error) {
+  console.error("Failed to fetch users:", error);
+}'''
+
+RUST_USERS = '''use std::time::Duration;
+use tokio::time::sleep;
+
+#[derive(Debug)]
+struct User {
+    name: String,
+    email: String,
+    age: u32,
+}
+
+async fn fetch_users() -> Result<Vec<User>, Box<dyn std::error::Error>> {
+    // Simulate API call
+    sleep(Duration::from_millis(100)).await;
+
+    Ok(vec![
+        User {
+            name: "Alice".to_string(),
+            email: "alice@example.com".to_string(),
+            age: 28,
+        },
+        User {
+            name: "Bob".to_string(),
+            email: "bob@example.com".to_string(),
+            age: 35,
+        },
+    ])
+}
+
+#[tokio::main]
+async fn main() -> Result<(), Box<dyn std::error::Error>> {
+    let users = fetch_users().await?;
+
+    for user in users {
+        println!("{}: {}", user.name, user.email);
+    }
+
+    Ok(())
+}'''
+
+PYTHON_STREAM_DATA = '''import asyncio
+from typing import AsyncIterator
+
+async def stream_data(items: list[str]) -> AsyncIterator[str]:
+    """Stream items with delay."""
+    for item in items:
+        await asyncio.sleep(0.1)
+        yield item
+
+async def main():
+    """Process streaming data."""
+    items = ["alpha", "beta", "gamma"]
+
+    async for item in stream_data(items):
+        print(f"Received: {item}")
+
+if __name__ == "__main__":
+    asyncio.run(main())'''
+
+PYTHON_FIBONACCI = '''from functools import lru_cache
+
+@lru_cache(maxsize=None)
+def fibonacci(n: int) -> int:
+    """Calculate nth Fibonacci number with memoization."""
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+def fib_iter(n: int) -> int:
+    """Calculate nth Fibonacci number in O(n) time and O(1) space."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+# Test
+for i in range(10):
+    assert fibonacci(i) == fib_iter(i)
+    print(f"fib({i}) = {fib_iter(i)}")'''
+
+GO_WORKER_POOL = '''package main
+
+import (
+    "fmt"
+    "sync"
+)
+
+// Worker pool pattern
+type Task struct {
+    ID   int
+    Data string
+}
+
+func worker(id int, tasks <-chan Task, results chan<- string, wg *sync.WaitGroup) {
+    defer wg.Done()
+
+    for task := range tasks {
+        result := fmt.Sprintf("Worker %d processed task %d: %s", id, task.ID, task.Data)
+        results <- result
+    }
+}
+
+func main() {
+    tasks := make(chan Task, 10)
+    results := make(chan string, 10)
+
+    var wg sync.WaitGroup
+
+    // Start workers
+    for i := 1; i <= 3; i++ {
+        wg.Add(1)
+        go worker(i, tasks, results, &wg)
+    }
+
+    // Send tasks
+    for i := 1; i <= 5; i++ {
+        tasks <- Task{ID: i, Data: fmt.Sprintf("data-%d", i)}
+    }
+    close(tasks)
+
+    // Close results after workers finish
+    go func() {
+        wg.Wait()
+        close(results)
+    }()
+
+    // Collect results
+    for result := range results {
+        fmt.Println(result)
+    }
+}'''
+
+PYTHON_HELLO = '''def hello(name: str) -> str:
+    """Greet someone."""
+    return f"Hello, {name}!"
+
+# Usage
+message = hello("World")
+print(message)'''
+
+GO_HELLO = '''package main
+
+import "fmt"
+
+func hello(name string) string {
+    return fmt.Sprintf("Hello, %s!", name)
+}
+
+func main() {
+    message := hello("World")
+    fmt.Println(message)
+}'''
@@ -16,6 +16,43 @@ from agentui.bridge import TUIConfig, managed_bridge
 from agentui import UIForm
 from agentui.primitives import text_field, checkbox_field
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# The form is static, so it is built and serialized once at import
+_PROFILE_FORM = UIForm(
+    title="Profile Setup",
+    description="Watch the smooth animation as this form appears",
+    fields=[
+        text_field("name", "Your Name", required=True, placeholder="John Doe"),
+        text_field("email", "Email", required=True, placeholder="john@example.com"),
+        checkbox_field("subscribe", "Subscribe to updates", default=True),
+    ],
+    submit_label="Save",
+    cancel_label="Cancel",
+)
+_PROFILE_FORM_DICT = _PROFILE_FORM.to_dict()
+
+
+async def send_paced(bridge, content: str, pace: float, done: bool = False) -> None:
+    """Send text, wait for it to render, and hold until ``pace`` seconds after the send.
+
+    The wait for the render is capped at ``pace``, so a slow TUI makes the
+    step run late instead of failing it. CLIBridge renders synchronously, so
+    its flush returns at once.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + pace
+    await bridge.send_text(content, done=done)
+    try:
+        await asyncio.wait_for(bridge.flush(), max(0.0, deadline - loop.time()))
+    except TimeoutError:
+        pass
+    await asyncio.sleep(max(0.0, deadline - loop.time()))
+
 
 async def test_animations():
     """Test smooth animations with forms and confirms."""
@@ -34,38 +71,24 @@ async def test_animations():
     async with managed_bridge(tui_config, fallback=True) as bridge:
         # Test 1: Show text message
         print("→ Sending welcome message...")
-        await bridge.send_text("Welcome! Watch for smooth animations when forms appear.", done=False)
-        await asyncio.sleep(2)
+        await send_paced(bridge, "Welcome! Watch for smooth animations when forms appear.", 2)
 
         # Test 2: Show form (should animate in smoothly)
         print("→ Showing form with animation...")
-        await bridge.send_text("Here comes a form with smooth fade-in animation!")
-        await asyncio.sleep(0.5)
-
-        # Create and send form
-        form = UIForm(
-            title="Profile Setup",
-            description="Watch the smooth animation as this form appears",
-            fields=[
-                text_field("name", "Your Name", required=True, placeholder="John Doe"),
-                text_field("email", "Email", required=True, placeholder="john@example.com"),
-                checkbox_field("subscribe", "Subscribe to updates", default=True),
-            ],
-            submit_label="Save",
-            cancel_label="Cancel",
-        )
+        await send_paced(bridge, "Here comes a form with smooth fade-in animation!", 0.5)
 
         # Send the form (request_form waits for user response)
         try:
-            response = await bridge.request_form(form.to_dict())
+            response = await bridge.request_form(_PROFILE_FORM_DICT)
             print(f"→ Form response: {response}")
         except Exception as e:
             print(f"→ Form cancelled or error: {e}")
 
         # Test 3: Show another message
         print("→ Sending completion message...")
-        await bridge.send_text("Animation test complete! Notice the smooth transitions.", done=True)
-        await asyncio.sleep(2)
+        await send_paced(
+            bridge, "Animation test complete! Notice the smooth transitions.", 2, done=True
+        )
 
     print("\n✓ Animation test completed!\n")
 
@@ -81,4 +104,7 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+        if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+            runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+        runner.run(main())
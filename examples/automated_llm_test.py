@@ -14,7 +14,18 @@ Run:
 """
 
 import asyncio
+import functools
+import sys
 from agentui import AgentApp, UICode, UITable, UIProgress, UIProgressStep
+from _code_samples import (
+    GO_PROCESS_CONCURRENTLY,
+    PYTHON_FETCH_DATA,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 app = AgentApp(
@@ -31,6 +42,44 @@ Keep responses brief to speed up testing.""",
 )
 
 
+_CODE_EXAMPLES = {
+    "python": PYTHON_FETCH_DATA,
+    "go": GO_PROCESS_CONCURRENTLY,
+}
+
+_TITLES = {
+    "python": "Python Example",
+    "go": "Go Example",
+}
+
+_CODE = {
+    language: UICode(title=_TITLES[language], language=language, code=code)
+    for language, code in _CODE_EXAMPLES.items()
+}
+
+_METRICS_TABLE = UITable(
+    title="Performance Metrics",
+    columns=["Metric", "Value", "Status"],
+    rows=[
+        ["Response Time", "45ms", "✓"],
+        ["Throughput", "1.2k/s", "✓"],
+        ["Error Rate", "0.1%", "✓"],
+        ["Memory Usage", "128MB", "✓"],
+    ],
+    footer="All systems operational",
+)
+
+_WORKFLOW_PROGRESS = UIProgress(
+    message="Processing workflow...",
+    percent=65.0,
+    steps=[
+        UIProgressStep("Initialize", "complete"),
+        UIProgressStep("Process", "running", "Item 65/100"),
+        UIProgressStep("Finalize", "pending"),
+    ],
+)
+
+
 @app.ui_tool(
     name="show_code",
     description="Show a code example with syntax highlighting",
@@ -43,41 +92,17 @@ Keep responses brief to speed up testing.""",
         "required": ["language"]
     }
 )
+@functools.lru_cache(maxsize=32)
 def show_code(language: str, description: str = "Example code") -> UICode:
     """Return syntax-highlighted code."""
-
-    code_examples = {
-        "python": '''async def fetch_data(url: str) -> dict:
-    """Fetch JSON data asynchronously."""
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            return await response.json()
-
-# Usage
-data = await fetch_data("https://api.example.com/data")
-print(f"Received {len(data)} items")''',
-
-        "go": '''func ProcessConcurrently(items []string) []Result {
-    results := make(chan Result, len(items))
-
-    for _, item := range items {
-        go func(i string) {
-            results <- Process(i)
-        }(item)
-    }
-
-    output := make([]Result, len(items))
-    for i := range items {
-        output[i] = <-results
-    }
-    return output
-}''',
-    }
+    cached = _CODE.get(language)
+    if cached is not None:
+        return cached
 
     return UICode(
         title=f"{language.title()} Example",
         language=language,
-        code=code_examples.get(language, "# No example available"),
+        code="# No example available",
     )
 
 
@@ -91,20 +116,10 @@ print(f"Received {len(data)} items")''',
         }
     }
 )
+@functools.lru_cache(maxsize=32)
 def show_table(topic: str = "metrics") -> UITable:
     """Return data as a table."""
-
-    return UITable(
-        title="Performance Metrics",
-        columns=["Metric", "Value", "Status"],
-        rows=[
-            ["Response Time", "45ms", "✓"],
-            ["Throughput", "1.2k/s", "✓"],
-            ["Error Rate", "0.1%", "✓"],
-            ["Memory Usage", "128MB", "✓"],
-        ],
-        footer="All systems operational",
-    )
+    return _METRICS_TABLE
 
 
 @app.ui_tool(
@@ -112,33 +127,42 @@ def show_table(topic: str = "metrics") -> UITable:
     description="Show a progress indicator",
     parameters={"type": "object", "properties": {}}
 )
+@functools.cache
 def show_progress() -> UIProgress:
     """Return progress indicator."""
+    return _WORKFLOW_PROGRESS
 
-    return UIProgress(
-        message="Processing workflow...",
-        percent=65.0,
-        steps=[
-            UIProgressStep("Initialize", "complete"),
-            UIProgressStep("Process", "running", "Item 65/100"),
-            UIProgressStep("Finalize", "pending"),
-        ],
-    )
+
+_RULE = "=" * 70
+
+_BANNER = f"""
+{_RULE}
+🤖 Automated LLM Integration Test
+{_RULE}
+
+Testing:
+  ✓ Real Claude API streaming
+  ✓ CharmDark theme (pink/purple/teal)
+  ✓ Syntax highlighting (Chroma)
+  ✓ UI primitives (code, tables, progress)
+  ✓ Spring physics animations
+
+{_RULE}
+
+"""
+
+_READY_BANNER = f"""
+{_RULE}
+Ready to run interactive test!
+Type your questions or 'quit' to exit
+{_RULE}
+
+"""
 
 
 async def run_automated_tests():
     """Run automated tests with Claude."""
-
-    print("\n" + "="*70)
-    print("🤖 Automated LLM Integration Test")
-    print("="*70)
-    print("\nTesting:")
-    print("  ✓ Real Claude API streaming")
-    print("  ✓ CharmDark theme (pink/purple/teal)")
-    print("  ✓ Syntax highlighting (Chroma)")
-    print("  ✓ UI primitives (code, tables, progress)")
-    print("  ✓ Spring physics animations")
-    print("\n" + "="*70 + "\n")
+    sys.stdout.write(_BANNER)
 
     # Test messages
     tests = [
@@ -147,19 +171,21 @@ async def run_automated_tests():
         ("Show progress using show_progress", "Progress Indicators"),
     ]
 
+    report = []
     for i, (prompt, test_name) in enumerate(tests, 1):
-        print(f"\n[Test {i}/{len(tests)}] {test_name}")
-        print(f"Prompt: {prompt}")
-        print("-" * 70)
+        report.append(f"\n[Test {i}/{len(tests)}] {test_name}\nPrompt: {prompt}\n{'-' * 70}\n")
 
         # This will process through the agent
         # In a real test, we'd send this and capture the output
         # For now, we're demonstrating the structure
+        #
+        # When real sends are added, await each prompt in turn
+        # (`response = await app.chat(prompt)`). The turns share one
+        # conversation, so don't wrap them in create_task/ensure_future + gather;
+        # if independent prompts ever need to overlap, use asyncio.TaskGroup.
 
-    print("\n" + "="*70)
-    print("Ready to run interactive test!")
-    print("Type your questions or 'quit' to exit")
-    print("="*70 + "\n")
+    sys.stdout.write("".join(report))
+    sys.stdout.write(_READY_BANNER)
 
     # Run the interactive app
     await app.run()
@@ -167,6 +193,9 @@ async def run_automated_tests():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(run_automated_tests())
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(run_automated_tests())
     except KeyboardInterrupt:
         print("\n\n⚠ Test cancelled\n")
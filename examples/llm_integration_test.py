@@ -14,7 +14,20 @@ Run:
 """
 
 import asyncio
+import functools
+import sys
+import traceback
 from agentui import AgentApp, UITable, UICode, UIProgress, UIProgressStep
+from _code_samples import (
+    GO_WORKER_POOL,
+    PYTHON_FIBONACCI,
+    PYTHON_STREAM_DATA,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 # Create app with CharmDark theme
@@ -32,6 +45,69 @@ Be concise and showcase the beautiful UI.""",
 )
 
 
+_SYNTAX_EXAMPLES = {
+    ("python", "async"): PYTHON_STREAM_DATA,
+    ("python", "basic"): PYTHON_FIBONACCI,
+    ("go", "basic"): GO_WORKER_POOL,
+}
+
+_TITLES = {
+    "python": "Python",
+    "go": "Go",
+}
+
+_BENCHMARK_TABLES = {
+    "web": UITable(
+        title="Web Framework Benchmarks",
+        columns=["Framework", "Language", "Req/sec", "Latency (ms)", "Memory (MB)"],
+        rows=[
+            ["FastAPI", "Python", "12,400", "8.2", "45"],
+            ["Express", "Node.js", "18,200", "5.5", "62"],
+            ["Gin", "Go", "47,600", "2.1", "18"],
+            ["Actix", "Rust", "52,100", "1.9", "12"],
+            ["Spring", "Java", "15,800", "6.3", "180"],
+        ],
+        footer="Go and Rust show best performance",
+    ),
+    "database": UITable(
+        title="Database Query Performance",
+        columns=["Database", "Query Type", "Time (ms)", "Throughput"],
+        rows=[
+            ["PostgreSQL", "SELECT", "0.45", "22k/s"],
+            ["PostgreSQL", "INSERT", "1.2", "8.3k/s"],
+            ["MongoDB", "Find", "0.38", "26k/s"],
+            ["Redis", "GET", "0.12", "83k/s"],
+            ["MySQL", "SELECT", "0.52", "19k/s"],
+        ],
+        footer="Redis excels at key-value lookups",
+    ),
+}
+
+_STAGING_PROGRESS = UIProgress(
+    message="Deploying to staging...",
+    percent=50.0,
+    steps=[
+        UIProgressStep("Build", "complete", "Compiled in 2.1s"),
+        UIProgressStep("Test", "complete", "127 tests passed"),
+        UIProgressStep("Deploy", "running", "Pushing to staging..."),
+        UIProgressStep("Smoke Test", "pending"),
+    ],
+)
+
+_PROD_PROGRESS = UIProgress(
+    message="Deploying to production...",
+    percent=75.0,
+    steps=[
+        UIProgressStep("Build", "complete", "Compiled in 3.2s"),
+        UIProgressStep("Test", "complete", "127 tests passed"),
+        UIProgressStep("Security Scan", "complete", "No vulnerabilities"),
+        UIProgressStep("Deploy to Canary", "complete", "5% traffic"),
+        UIProgressStep("Monitor Metrics", "running", "Watching error rates..."),
+        UIProgressStep("Full Rollout", "pending"),
+    ],
+)
+
+
 @app.ui_tool(
     name="show_syntax_example",
     description="Show a syntax-highlighted code example in Python or Go",
@@ -51,106 +127,18 @@ Be concise and showcase the beautiful UI.""",
         "required": ["language", "topic"]
     }
 )
+@functools.lru_cache(maxsize=32)
 def show_syntax_example(language: str, topic: str) -> UICode:
     """Return a syntax-highlighted code example."""
-
     if language == "python":
-        if "async" in topic.lower():
-            code = '''import asyncio
-from typing import AsyncIterator
-
-async def stream_data(items: list[str]) -> AsyncIterator[str]:
-    """Stream items with delay."""
-    for item in items:
-        await asyncio.sleep(0.1)
-        yield item
-
-async def main():
-    """Process streaming data."""
-    items = ["alpha", "beta", "gamma"]
-
-    async for item in stream_data(items):
-        print(f"Received: {item}")
-
-if __name__ == "__main__":
-    asyncio.run(main())'''
-        else:
-            code = '''def fibonacci(n: int) -> int:
-    """Calculate nth Fibonacci number."""
-    if n <= 1:
-        return n
-    return fibonacci(n - 1) + fibonacci(n - 2)
-
-# Optimized with memoization
-from functools import lru_cache
-
-@lru_cache(maxsize=None)
-def fib_fast(n: int) -> int:
-    """Fast Fibonacci with caching."""
-    if n <= 1:
-        return n
-    return fib_fast(n - 1) + fib_fast(n - 2)
-
-# Test
-for i in range(10):
-    print(f"fib({i}) = {fib_fast(i)}")'''
+        key = ("python", "async" if "async" in topic.casefold() else "basic")
     else:  # Go
-        code = '''package main
-
-import (
-    "fmt"
-    "sync"
-)
-
-// Worker pool pattern
-type Task struct {
-    ID   int
-    Data string
-}
-
-func worker(id int, tasks <-chan Task, results chan<- string, wg *sync.WaitGroup) {
-    defer wg.Done()
-
-    for task := range tasks {
-        result := fmt.Sprintf("Worker %d processed task %d: %s", id, task.ID, task.Data)
-        results <- result
-    }
-}
-
-func main() {
-    tasks := make(chan Task, 10)
-    results := make(chan string, 10)
-
-    var wg sync.WaitGroup
-
-    // Start workers
-    for i := 1; i <= 3; i++ {
-        wg.Add(1)
-        go worker(i, tasks, results, &wg)
-    }
-
-    // Send tasks
-    for i := 1; i <= 5; i++ {
-        tasks <- Task{ID: i, Data: fmt.Sprintf("data-%d", i)}
-    }
-    close(tasks)
-
-    // Close results after workers finish
-    go func() {
-        wg.Wait()
-        close(results)
-    }()
-
-    // Collect results
-    for result := range results {
-        fmt.Println(result)
-    }
-}'''
+        key = ("go", "basic")
 
     return UICode(
-        title=f"{language.title()} - {topic}",
+        title=f"{_TITLES.get(language) or language.title()} - {topic}",
         language=language,
-        code=code,
+        code=_SYNTAX_EXAMPLES[key],
     )
 
 
@@ -167,35 +155,10 @@ func main() {
         }
     }
 )
+@functools.lru_cache(maxsize=32)
 def show_benchmark_results(framework: str = "web") -> UITable:
     """Return benchmark results as a table."""
-
-    if framework == "web":
-        return UITable(
-            title="Web Framework Benchmarks",
-            columns=["Framework", "Language", "Req/sec", "Latency (ms)", "Memory (MB)"],
-            rows=[
-                ["FastAPI", "Python", "12,400", "8.2", "45"],
-                ["Express", "Node.js", "18,200", "5.5", "62"],
-                ["Gin", "Go", "47,600", "2.1", "18"],
-                ["Actix", "Rust", "52,100", "1.9", "12"],
-                ["Spring", "Java", "15,800", "6.3", "180"],
-            ],
-            footer="Go and Rust show best performance",
-        )
-    else:
-        return UITable(
-            title="Database Query Performance",
-            columns=["Database", "Query Type", "Time (ms)", "Throughput"],
-            rows=[
-                ["PostgreSQL", "SELECT", "0.45", "22k/s"],
-                ["PostgreSQL", "INSERT", "1.2", "8.3k/s"],
-                ["MongoDB", "Find", "0.38", "26k/s"],
-                ["Redis", "GET", "0.12", "83k/s"],
-                ["MySQL", "SELECT", "0.52", "19k/s"],
-            ],
-            footer="Redis excels at key-value lookups",
-        )
+    return _BENCHMARK_TABLES["web" if framework == "web" else "database"]
 
 
 @app.ui_tool(
@@ -212,48 +175,41 @@ def show_benchmark_results(framework: str = "web") -> UITable:
         }
     }
 )
+@functools.lru_cache(maxsize=32)
 def simulate_deployment(environment: str = "staging") -> UIProgress:
     """Return deployment progress."""
+    return _PROD_PROGRESS if environment == "production" else _STAGING_PROGRESS
 
-    if environment == "production":
-        steps = [
-            UIProgressStep("Build", "complete", "Compiled in 3.2s"),
-            UIProgressStep("Test", "complete", "127 tests passed"),
-            UIProgressStep("Security Scan", "complete", "No vulnerabilities"),
-            UIProgressStep("Deploy to Canary", "complete", "5% traffic"),
-            UIProgressStep("Monitor Metrics", "running", "Watching error rates..."),
-            UIProgressStep("Full Rollout", "pending"),
-        ]
-        percent = 75.0
-        message = "Deploying to production..."
-    else:
-        steps = [
-            UIProgressStep("Build", "complete", "Compiled in 2.1s"),
-            UIProgressStep("Test", "complete", "127 tests passed"),
-            UIProgressStep("Deploy", "running", "Pushing to staging..."),
-            UIProgressStep("Smoke Test", "pending"),
-        ]
-        percent = 50.0
-        message = "Deploying to staging..."
-
-    return UIProgress(
-        message=message,
-        percent=percent,
-        steps=steps,
-    )
+
+_RULE = "=" * 60
+
+_BANNER = f"""
+{_RULE}
+🎨 AgentUI - LLM Integration Test
+{_RULE}
+
+Testing with Claude API:
+  • CharmDark theme (pink/purple/teal)
+  • Syntax highlighting with Chroma
+  • Spring physics animations
+  • Real streaming responses
+
+{_RULE}
+
+"""
+
+_SESSION_BANNER = f"""
+{_RULE}
+Starting interactive session...
+Type 'test' to run automated tests, or ask your own questions
+{_RULE}
+
+"""
 
 
 async def main():
     """Run the LLM integration test."""
-    print("\n" + "="*60)
-    print("🎨 AgentUI - LLM Integration Test")
-    print("="*60)
-    print("\nTesting with Claude API:")
-    print("  • CharmDark theme (pink/purple/teal)")
-    print("  • Syntax highlighting with Chroma")
-    print("  • Spring physics animations")
-    print("  • Real streaming responses")
-    print("\n" + "="*60 + "\n")
+    sys.stdout.write(_BANNER)
 
     # Test prompts that showcase features
     test_prompts = [
@@ -264,23 +220,21 @@ async def main():
     ]
 
     print("Test prompts prepared:")
-    for i, prompt in enumerate(test_prompts, 1):
-        print(f"  {i}. {prompt}")
+    print("\n".join(f"  {i}. {prompt}" for i, prompt in enumerate(test_prompts, 1)))
 
-    print("\n" + "="*60)
-    print("Starting interactive session...")
-    print("Type 'test' to run automated tests, or ask your own questions")
-    print("="*60 + "\n")
+    sys.stdout.write(_SESSION_BANNER)
 
     await app.run()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠ Test interrupted by user\n")
     except Exception as e:
         print(f"\n✗ Error: {e}\n")
-        import traceback
         traceback.print_exc()
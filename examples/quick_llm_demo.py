@@ -13,18 +13,22 @@ Run:
 """
 
 import asyncio
+import functools
 import os
+import sys
+import traceback
 from agentui import AgentApp, UICode
+from _code_samples import (
+    GO_USERS,
+    PYTHON_USERS,
+    RUST_USERS,
+    TYPESCRIPT_USERS,
+)
 
-
-# Check for API key
-if not os.environ.get("ANTHROPIC_API_KEY"):
-    print("❌ Error: ANTHROPIC_API_KEY not set")
-    print("\nSet it with:")
-    print("  export ANTHROPIC_API_KEY='your-key-here'")
-    exit(1)
-
-print("\n✅ API key found - starting demo...\n")
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 
 # Create app with CharmDark theme
@@ -42,6 +46,26 @@ Be enthusiastic and concise. Showcase the Charm aesthetic!""",
 )
 
 
+_CODE_EXAMPLES = {
+    "python": PYTHON_USERS,
+    "go": GO_USERS,
+    "typescript": TYPESCRIPT_USERS,
+    "rust": RUST_USERS,
+}
+
+_TITLES = {
+    "python": "Beautiful Python Code",
+    "go": "Beautiful Go Code",
+    "typescript": "Beautiful TypeScript Code",
+    "rust": "Beautiful Rust Code",
+}
+
+_CODE = {
+    language: UICode(title=_TITLES[language], language=language, code=code)
+    for language, code in _CODE_EXAMPLES.items()
+}
+
+
 @app.ui_tool(
     name="show_code_example",
     description="Show a beautiful syntax-highlighted code example",
@@ -57,173 +81,61 @@ Be enthusiastic and concise. Showcase the Charm aesthetic!""",
         "required": ["language"]
     }
 )
+@functools.lru_cache(maxsize=32)
 def show_code_example(language: str) -> UICode:
     """Return a syntax-highlighted code example."""
+    cached = _CODE.get(language)
+    if cached is not None:
+        return cached
 
-    examples = {
-        "python": '''import asyncio
-from dataclasses import dataclass
-
-@dataclass
-class User:
-    """User model with validation."""
-    name: str
-    email: str
-    age: int
-
-    def __post_init__(self):
-        if self.age < 0:
-            raise ValueError("Age must be positive")
-
-async def fetch_users() -> list[User]:
-    """Fetch users asynchronously."""
-    # Simulate API call
-    await asyncio.sleep(0.1)
-
-    return [
-        User("Alice", "alice@example.com", 28),
-        User("Bob", "bob@example.com", 35),
-    ]
-
-# Usage
-users = await fetch_users()
-for user in users:
-    print(f"{user.name}: {user.email}")''',
-
-        "go": '''package main
-
-import (
-    "context"
-    "fmt"
-    "time"
-)
-
-type User struct {
-    Name  string
-    Email string
-    Age   int
-}
-
-func FetchUsers(ctx context.Context) ([]User, error) {
-    // Simulate API call with context
-    select {
-    case <-time.After(100 * time.Millisecond):
-        return []User{
-            {Name: "Alice", Email: "alice@example.com", Age: 28},
-            {Name: "Bob", Email: "bob@example.com", Age: 35},
-        }, nil
-    case <-ctx.Done():
-        return nil, ctx.Err()
-    }
-}
-
-func main() {
-    ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
-    defer cancel()
-
-    users, err := FetchUsers(ctx)
-    if err != nil {
-        fmt.Printf("Error: %v\\n", err)
-        return
-    }
+    return UICode(
+        title=f"Beautiful {language.title()} Code",
+        language=language,
+        code="# Example not found",
+    )
 
-    for _, user := range users {
-        fmt.Printf("%s: %s\\n", user.Name, user.Email)
-    }
-}''',
 
-        "typescript": '''interface User {
-  name: string;
-  email: string;
-  age: number;
-}
+def _check_env() -> None:
+    """Exit early with setup instructions if the API key is missing."""
+    if not os.environ.get("ANTHROPIC_API_KEY"):
+        print("❌ Error: ANTHROPIC_API_KEY not set")
+        print("\nSet it with:")
+        print("  export ANTHROPIC_API_KEY='your-key-here'")
+        sys.exit(1)
 
-async function fetchUsers(): Promise<User[]> {
-  // Simulate API call
-  await new Promise(resolve => setTimeout(resolve, 100));
+    print("\n✅ API key found - starting demo...\n")
 
-  return [
-    { name: "Alice", email: "alice@example.com", age: 28 },
-    { name: "Bob", email: "bob@example.com", age: 35 },
-  ];
-}
 
-// Usage with error handling
-try {
-  const users = await fetchUsers();
-  users.forEach(user => {
-    console.log(`${user.name}: ${user.email}`);
-  });
-} catch (error) {
-  console.error("Failed to fetch users:", error);
-}''',
-
-        "rust": '''use std::time::Duration;
-use tokio::time::sleep;
-
-#[derive(Debug)]
-struct User {
-    name: String,
-    email: String,
-    age: u32,
-}
+_RULE = "=" * 70
 
-async fn fetch_users() -> Result<Vec<User>, Box<dyn std::error::Error>> {
-    // Simulate API call
-    sleep(Duration::from_millis(100)).await;
+_BANNER = f"""{_RULE}
+🎨 AgentUI Quick Demo - Real Claude Integration
+{_RULE}
 
-    Ok(vec![
-        User {
-            name: "Alice".to_string(),
-            email: "alice@example.com".to_string(),
-            age: 28,
-        },
-        User {
-            name: "Bob".to_string(),
-            email: "bob@example.com".to_string(),
-            age: 35,
-        },
-    ])
-}
+Features being tested:
+  • Real streaming responses from Claude Sonnet 4.5
+  • CharmDark theme (pink/purple/teal aesthetic)
+  • Syntax highlighting with Chroma
+  • Spring physics animations
+  • Full Python↔Go TUI communication
 
-#[tokio::main]
-async fn main() -> Result<(), Box<dyn std::error::Error>> {
-    let users = fetch_users().await?;
+{_RULE}
 
-    for user in users {
-        println!("{}: {}", user.name, user.email);
-    }
+Try asking:
+  'Show me Python code using show_code_example'
+  'Show me Go code'
+  'Show me TypeScript code'
+  'Explain async/await in Python'
 
-    Ok(())
-}''',
-    }
+{_RULE}
 
-    return UICode(
-        title=f"Beautiful {language.title()} Code",
-        language=language,
-        code=examples.get(language, "# Example not found"),
-    )
+"""
 
 
 async def main():
     """Run the quick demo."""
-
-    print("="*70)
-    print("🎨 AgentUI Quick Demo - Real Claude Integration")
-    print("="*70)
-    print("\nFeatures being tested:")
-    print("  • Real streaming responses from Claude Sonnet 4.5")
-    print("  • CharmDark theme (pink/purple/teal aesthetic)")
-    print("  • Syntax highlighting with Chroma")
-    print("  • Spring physics animations")
-    print("  • Full Python↔Go TUI communication")
-    print("\n" + "="*70)
-    print("\nTry asking:")
-    print("  'Show me Python code using show_code_example'")
-    print("  'Show me Go code'")
-    print("  'Show me TypeScript code'")
-    print("  'Explain async/await in Python'")
-    print("\n" + "="*70 + "\n")
+    _check_env()
+    sys.stdout.write(_BANNER)
 
     # Run the interactive app
     await app.run()
@@ -231,10 +143,12 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop if uvloop else None) as runner:
+            if hasattr(asyncio, "eager_task_factory"):  # Python 3.12+
+                runner.get_loop().set_task_factory(asyncio.eager_task_factory)
+            runner.run(main())
     except KeyboardInterrupt:
         print("\n\n⚠ Demo cancelled by user\n")
     except Exception as e:
         print(f"\n❌ Error: {e}\n")
-        import traceback
         traceback.print_exc()
@@ -17,11 +17,21 @@ Run:
 """
 
 import asyncio
+import functools
+import importlib.util
 import sys
 import logging
 import os
+import re
+import shlex
+import shutil
+import signal
 import subprocess
+import time
+from collections import deque
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 # Add src to path for development
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -116,6 +126,87 @@ Always be helpful, concise, and context-aware.""",
 )
 
 
+# Distribution name -> import name
+_PACKAGES = {
+    "anthropic": "anthropic",
+    "openai": "openai",
+    "rich": "rich",
+    "pyyaml": "yaml",
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _probe_packages() -> dict[str, str]:
+    """Report which key packages are importable (cached for the process).
+
+    Uses find_spec so the packages are located without being imported.
+    """
+    return {
+        package: (
+            "✅ Installed" if importlib.util.find_spec(module) is not None
+            else "❌ Not installed"
+        )
+        for package, module in _PACKAGES.items()
+    }
+
+
+# (monotonic timestamp, uv path, binary mtime, status)
+_uv_probe: tuple[float, str | None, int | None, str] | None = None
+
+
+def _probe_uv(ttl: float = 60) -> str:
+    """Report the uv version.
+
+    Results are reused for ``ttl`` seconds. After that the binary is looked
+    up and stat'ed again, and `uv --version` only re-runs if it changed.
+    """
+    global _uv_probe
+    now = time.monotonic()
+    if _uv_probe is not None and now - _uv_probe[0] < ttl:
+        return _uv_probe[3]
+
+    path = shutil.which("uv")
+    try:
+        mtime = os.stat(path).st_mtime_ns if path else None
+    except OSError:
+        path, mtime = None, None
+
+    if _uv_probe is not None and _uv_probe[1:3] == (path, mtime):
+        status = _uv_probe[3]
+    elif path is None:
+        status = "❌ Not installed"
+    else:
+        try:
+            uv_version = subprocess.check_output([path, "--version"], text=True).strip()
+            status = f"✅ {uv_version}"
+        except (subprocess.CalledProcessError, OSError):
+            status = "❌ Not installed"
+
+    _uv_probe = (now, path, mtime, status)
+    return status
+
+
+# Masked form of each key value seen; env values rarely change within a session
+_MASK_CACHE: dict[str, str] = {}
+
+
+def _mask_key(value: str) -> str:
+    """Mask an API key, keeping only its prefix and last 4 chars."""
+    masked = _MASK_CACHE.get(value)
+    if masked is None:
+        masked = f"{value[:7]}...{value[-4:]}" if len(value) > 15 else "sk-***"
+        _MASK_CACHE[value] = masked
+    return masked
+
+
+def _clear_probe_caches() -> None:
+    """Forget cached package and uv probes and masked keys."""
+    global _uv_probe
+    _probe_packages.cache_clear()
+    _MASK_CACHE.clear()
+    _uv_probe = None
+
+
 @app.tool(
     name="check_environment",
     description="Check the current development environment: installed packages, API keys, Python version, etc.",
@@ -136,17 +227,8 @@ def check_environment(check_type: str) -> dict:
     result = {"check_type": check_type}
 
     if check_type in ["packages", "all"]:
-        # Check if key packages are installed
-        packages_status = {}
-
-        for package in ["anthropic", "openai", "rich", "pyyaml"]:
-            try:
-                __import__(package)
-                packages_status[package] = "✅ Installed"
-            except ImportError:
-                packages_status[package] = "❌ Not installed"
-
-        result["packages"] = packages_status
+        # Check if key packages are installed (copied so callers can't mutate the cache)
+        result["packages"] = dict(_probe_packages())
 
         # Check Python version
         result["python_version"] = sys.version.split()[0]
@@ -158,79 +240,105 @@ def check_environment(check_type: str) -> dict:
         for key_name in ["ANTHROPIC_API_KEY", "OPENAI_API_KEY"]:
             value = os.environ.get(key_name)
             if value:
-                # Show first/last 4 chars only
-                masked = f"{value[:7]}...{value[-4:]}" if len(value) > 15 else "sk-***"
-                api_keys_status[key_name] = f"✅ Set ({masked})"
+                api_keys_status[key_name] = f"✅ Set ({_mask_key(value)})"
             else:
                 api_keys_status[key_name] = "❌ Not set"
 
         result["api_keys"] = api_keys_status
 
     # Check uv availability
-    try:
-        uv_version = subprocess.check_output(["uv", "--version"], text=True).strip()
-        result["uv"] = f"✅ {uv_version}"
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        result["uv"] = "❌ Not installed"
+    result["uv"] = _probe_uv()
 
     return result
 
 
-@app.tool(
-    name="diagnose_error",
-    description="Analyze an error message and provide a diagnosis with fix suggestions.",
-    parameters={
-        "type": "object",
-        "properties": {
-            "error_message": {
-                "type": "string",
-                "description": "The error message to diagnose"
-            }
-        },
-        "required": ["error_message"]
-    }
-)
-def diagnose_error(error_message: str) -> dict:
-    """Diagnose an error and suggest fixes."""
-    error_lower = error_message.lower()
+check_environment.cache_clear = _clear_probe_caches
 
-    diagnoses = []
 
-    # Check for common errors
-    if "anthropic" in error_lower and ("not installed" in error_lower or "no module" in error_lower):
-        diagnoses.append({
+_MISSING_MODULE = frozenset({"not installed", "no module"})
+
+# Each rule matches when every keyword group has at least one hit in the error
+_DIAGNOSES: list[tuple[tuple[frozenset[str], ...], dict]] = [
+    (
+        (frozenset({"anthropic"}), _MISSING_MODULE),
+        {
             "issue": "Anthropic package not installed",
             "cause": "The anthropic package is an optional dependency. Running 'uv sync' only installs core dependencies.",
             "fix": "uv sync --extra claude",
             "alternative": "uv sync --extra all",
             "explanation": "The --extra flag installs optional dependency groups defined in pyproject.toml"
-        })
-
-    elif "openai" in error_lower and ("not installed" in error_lower or "no module" in error_lower):
-        diagnoses.append({
+        },
+    ),
+    (
+        (frozenset({"openai"}), _MISSING_MODULE),
+        {
             "issue": "OpenAI package not installed",
             "cause": "The openai package is an optional dependency.",
             "fix": "uv sync --extra openai",
             "alternative": "uv sync --extra all",
             "explanation": "The --extra flag installs optional dependency groups"
-        })
-
-    elif "api key" in error_lower or "anthropic_api_key" in error_lower:
-        diagnoses.append({
+        },
+    ),
+    (
+        (frozenset({"api key", "anthropic_api_key"}),),
+        {
             "issue": "Missing Anthropic API key",
             "cause": "The ANTHROPIC_API_KEY environment variable is not set",
             "fix": "export ANTHROPIC_API_KEY='sk-ant-...'",
             "explanation": "Get your API key from: https://console.anthropic.com/settings/keys",
             "persistent": "Add to ~/.zshrc or ~/.bashrc to make it permanent"
-        })
-
-    elif "openai_api_key" in error_lower:
-        diagnoses.append({
+        },
+    ),
+    (
+        (frozenset({"openai_api_key"}),),
+        {
             "issue": "Missing OpenAI API key",
             "cause": "The OPENAI_API_KEY environment variable is not set",
             "fix": "export OPENAI_API_KEY='sk-...'",
             "explanation": "Get your API key from: https://platform.openai.com/api-keys"
-        })
+        },
+    ),
+]
+
+# Every keyword is scanned for once per call, however many rules use it
+_DIAGNOSIS_KEYWORDS = frozenset().union(*(group for groups, _ in _DIAGNOSES for group in groups))
+
+
+@functools.lru_cache(maxsize=256)
+def _match_diagnosis(error_key: str) -> dict | None:
+    """Return the first rule's diagnosis matching a normalized error message.
+
+    Matching is deterministic, so repeated errors are answered from the cache.
+    """
+    found = {keyword for keyword in _DIAGNOSIS_KEYWORDS if keyword in error_key}
+
+    # Rules are in priority order; only the first match is reported
+    for groups, diagnosis in _DIAGNOSES:
+        if all(found & group for group in groups):
+            return diagnosis
+
+    return None
+
+
+@app.tool(
+    name="diagnose_error",
+    description="Analyze an error message and provide a diagnosis with fix suggestions.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "error_message": {
+                "type": "string",
+                "description": "The error message to diagnose"
+            }
+        },
+        "required": ["error_message"]
+    },
+    cacheable=True,  # Deterministic; repeated errors reuse the result
+)
+def diagnose_error(error_message: str) -> dict:
+    """Diagnose an error and suggest fixes."""
+    diagnosis = _match_diagnosis(error_message.lower().strip())
+    diagnoses = [diagnosis] if diagnosis else []
 
     if not diagnoses:
         # Generic diagnosis
@@ -247,6 +355,80 @@ def diagnose_error(error_message: str) -> dict:
     }
 
 
+# Only the tail of each output stream is kept, so verbose installs can't grow without bound
+_OUTPUT_TAIL_LINES = 200
+_READ_CHUNK_SIZE = 64 * 1024
+_OUTPUT_TAIL_CHUNKS = 16
+
+
+async def _drain(stream: asyncio.StreamReader, tail: deque[bytes]) -> None:
+    """Read a stream to EOF in fixed-size chunks, keeping only the latest ones.
+
+    Chunks rather than lines, so a single huge line can't overrun the
+    StreamReader's line limit.
+    """
+    while chunk := await stream.read(_READ_CHUNK_SIZE):
+        tail.append(chunk)
+
+
+def _tail_text(tail: deque[bytes]) -> str:
+    """Decode the kept chunks and return the last output lines."""
+    lines = b"".join(tail).decode(errors="replace").splitlines()
+    return "\n".join(lines[-_OUTPUT_TAIL_LINES:]).strip()
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill the command and anything it spawned.
+
+    The command leads its own session, so the shell's children (and any
+    pipes they hold open) go down with it.
+    """
+    try:
+        os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+
+
+# Anything that needs /bin/sh to interpret (pipes, redirects, globs, subshells,
+# expansions, escapes, ...)
+_SHELL_SYNTAX = frozenset("|&;<>()`*?[]{}#\n$~\\")
+
+# Builtins and keywords run inside the shell, and some have no binary at all
+_SHELL_BUILTINS = frozenset({
+    "!", ".", ":", "[", "alias", "bg", "break", "builtin", "case", "cd",
+    "command", "continue", "declare", "do", "done", "echo", "elif", "else",
+    "esac", "eval", "exec", "exit", "export", "false", "fc", "fg", "fi", "for",
+    "function", "getopts", "hash", "history", "if", "jobs", "kill", "let",
+    "local", "popd", "printf", "pushd", "pwd", "read", "readonly", "return",
+    "select", "set", "shift", "source", "test", "then", "time", "times", "trap",
+    "true", "type", "typeset", "ulimit", "umask", "unalias", "unset", "until",
+    "wait", "while",
+})
+
+_ASSIGNMENT = re.compile(r"[A-Za-z_][A-Za-z0-9_]*=")
+
+
+def _split_command(command: str) -> list[str] | None:
+    """Split a simple command into argv, or return None if it needs a shell.
+
+    Only commands that /bin/sh would pass through unchanged are exec'd
+    directly; anything with expansions, escapes, leading NAME=value words or
+    a builtin goes to the shell.
+    """
+    if _SHELL_SYNTAX.intersection(command):
+        return None
+
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+
+    if not args or args[0] in _SHELL_BUILTINS or _ASSIGNMENT.match(args[0]):
+        return None
+
+    return args
+
+
 @app.tool(
     name="run_command",
     description="Execute a shell command. Use this to install packages, check versions, etc. Ask user for permission first for destructive operations.",
@@ -265,26 +447,60 @@ def diagnose_error(error_message: str) -> dict:
         "required": ["command", "description"]
     }
 )
-def run_command(command: str, description: str) -> dict:
-    """Execute a shell command and return the result."""
+async def run_command(command: str, description: str) -> dict:
+    """Execute a shell command and return the result.
+
+    The command runs as an asyncio subprocess, so the TUI and other tool
+    calls keep going while it does. Simple commands are exec'd directly;
+    anything the shell has to interpret goes through /bin/sh.
+    """
+    stdout_tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_CHUNKS)
+    stderr_tail: deque[bytes] = deque(maxlen=_OUTPUT_TAIL_CHUNKS)
+    pipes = {
+        "stdout": asyncio.subprocess.PIPE,
+        "stderr": asyncio.subprocess.PIPE,
+        "start_new_session": True,
+    }
+
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+        args = _split_command(command)
+        if args is None:
+            process = await asyncio.create_subprocess_shell(command, **pipes)
+        else:
+            try:
+                process = await asyncio.create_subprocess_exec(*args, **pipes)
+            except FileNotFoundError:
+                # Report a missing program the way the shell would
+                return {
+                    "command": command,
+                    "description": description,
+                    "exit_code": 127,
+                    "stdout": "",
+                    "stderr": f"{args[0]}: command not found",
+                    "success": False
+                }
+
+        try:
+            async with asyncio.timeout(30):
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(_drain(process.stdout, stdout_tail))
+                    tg.create_task(_drain(process.stderr, stderr_tail))
+                returncode = await process.wait()
+        except BaseException:
+            # Timed out, cancelled or failed: don't leave the command running
+            _kill_process_group(process)
+            await process.wait()
+            raise
 
         return {
             "command": command,
             "description": description,
-            "exit_code": result.returncode,
-            "stdout": result.stdout.strip() if result.stdout else "",
-            "stderr": result.stderr.strip() if result.stderr else "",
-            "success": result.returncode == 0
+            "exit_code": returncode,
+            "stdout": _tail_text(stdout_tail),
+            "stderr": _tail_text(stderr_tail),
+            "success": returncode == 0
         }
-    except subprocess.TimeoutExpired:
+    except TimeoutError:
         return {
             "command": command,
             "description": description,
@@ -300,25 +516,9 @@ def run_command(command: str, description: str) -> dict:
         }
 
 
-@app.tool(
-    name="show_installation_guide",
-    description="Show installation instructions for AgentUI and its dependencies.",
-    parameters={
-        "type": "object",
-        "properties": {
-            "topic": {
-                "type": "string",
-                "enum": ["quick_start", "providers", "troubleshooting", "all"],
-                "description": "Which guide to show"
-            }
-        },
-        "required": ["topic"]
-    }
-)
-def show_installation_guide(topic: str) -> dict:
-    """Return installation guide content."""
-    guides = {
-        "quick_start": """
+# Guides are static, so they are frozen at import and "all" is joined once
+_GUIDES: Mapping[str, str] = MappingProxyType({
+    "quick_start": """
 # Quick Start Installation
 
 1. Install all dependencies:
@@ -336,7 +536,7 @@ def show_installation_guide(topic: str) -> dict:
    uv run python examples/simple_agent.py
    ```
 """,
-        "providers": """
+    "providers": """
 # Installing LLM Providers
 
 AgentUI uses optional dependencies for different providers:
@@ -358,7 +558,7 @@ export OPENAI_API_KEY="sk-..."
 uv sync --extra all
 ```
 """,
-        "troubleshooting": """
+    "troubleshooting": """
 # Common Issues
 
 **"anthropic package not installed":**
@@ -374,45 +574,71 @@ uv sync --extra all
 - uv not installed
 - Fix: `curl -LsSf https://astral.sh/uv/install.sh | sh`
 """
-    }
+})
+_GUIDE_ALL = "\n\n".join(_GUIDES.values())
+
 
+@app.tool(
+    name="show_installation_guide",
+    description="Show installation instructions for AgentUI and its dependencies.",
+    parameters={
+        "type": "object",
+        "properties": {
+            "topic": {
+                "type": "string",
+                "enum": ["quick_start", "providers", "troubleshooting", "all"],
+                "description": "Which guide to show"
+            }
+        },
+        "required": ["topic"]
+    },
+    cacheable=True,  # Pure lookup; repeated calls reuse the result
+)
+def show_installation_guide(topic: str) -> dict:
+    """Return installation guide content."""
     if topic == "all":
         return {
             "topic": topic,
-            "content": "\n\n".join(guides.values())
+            "content": _GUIDE_ALL
         }
 
     return {
         "topic": topic,
-        "content": guides.get(topic, "Unknown topic")
+        "content": _GUIDES.get(topic, "Unknown topic")
     }
 
 
+_RULE = "=" * 60
+
+_BANNER = f"""
+{_RULE}
+🤖 AgentUI Smart Assistant
+{_RULE}
+
+I'm your intelligent development assistant for AgentUI.
+
+I can help you:
+  • Troubleshoot installation issues
+  • Check your environment setup
+  • Diagnose error messages
+  • Run commands to fix problems
+  • Answer questions about the project
+
+Try saying:
+  • "I'm getting an error about anthropic not installed"
+  • "Check my environment"
+  • "Help me install dependencies"
+  • "I ran uv sync but examples don't work"
+
+Type 'quit' or press Ctrl+C to exit.
+{_RULE}
+
+"""
+
+
 async def main():
     """Run the smart assistant."""
-    print()
-    print("=" * 60)
-    print("🤖 AgentUI Smart Assistant")
-    print("=" * 60)
-    print()
-    print("I'm your intelligent development assistant for AgentUI.")
-    print()
-    print("I can help you:")
-    print("  • Troubleshoot installation issues")
-    print("  • Check your environment setup")
-    print("  • Diagnose error messages")
-    print("  • Run commands to fix problems")
-    print("  • Answer questions about the project")
-    print()
-    print("Try saying:")
-    print('  • "I\'m getting an error about anthropic not installed"')
-    print('  • "Check my environment"')
-    print('  • "Help me install dependencies"')
-    print('  • "I ran uv sync but examples don\'t work"')
-    print()
-    print("Type 'quit' or press Ctrl+C to exit.")
-    print("=" * 60)
-    print()
+    sys.stdout.write(_BANNER)
 
     try:
         await app.run()
@@ -14,35 +14,11 @@ Run:
 import asyncio
 import sys
 
+from agentui import UICode, UIMarkdown, UIProgress, UIProgressStep, UITable, UIText
+from agentui.bridge import TUIConfig, managed_bridge
 
-async def test_theme(theme_name: str):
-    """Test a theme by showing various UI elements."""
-
-    print(f"\n{'='*60}")
-    print(f"Testing theme: {theme_name}")
-    print(f"{'='*60}\n")
-
-    # Import bridge utilities
-    from agentui.bridge import TUIConfig, managed_bridge
-
-    # Create TUI config
-    tui_config = TUIConfig(
-        theme=theme_name,
-        app_name="Theme Test",
-        tagline=f"Testing {theme_name}",
-        debug=False,
-    )
-
-    # Use managed bridge context
-    async with managed_bridge(tui_config, fallback=True) as bridge:
-        # Test 1: Text message
-        print("→ Sending text message...")
-        await bridge.send_text("Welcome to AgentUI Theme Test!", done=False)
-        await asyncio.sleep(0.5)
-
-        # Test 2: Markdown
-        print("→ Showing markdown...")
-        await bridge.send_markdown("""
+# Payload pieces are identical for every theme, so they are built once at import
+_MARKDOWN_TEMPLATE = """
 # AgentUI Theme Test
 
 Testing the **{theme}** theme with various UI components.
@@ -53,42 +29,33 @@ Testing the **{theme}** theme with various UI components.
 - Multiple theme support
 
 > This is a blockquote to test styling
-""".format(theme=theme_name), title="Theme Documentation")
-        await asyncio.sleep(1.5)
-
-        # Test 3: Table
-        print("→ Showing table...")
-        await bridge.send_table(
-            title="Cloud Costs",
-            columns=["Service", "Tier", "Monthly Cost"],
-            rows=[
-                ["EC2", "t3.medium", "$30.00"],
-                ["RDS", "db.t3.small", "$25.00"],
-                ["S3", "Standard", "$5.00"],
-                ["Lambda", "1M reqs", "$2.00"],
-            ],
-            footer="Total: $60/month",
-        )
-        await asyncio.sleep(1.5)
-
-        # Test 4: Progress
-        print("→ Showing progress...")
-        await bridge.send_progress(
-            message="Deploying application...",
-            percent=65.0,
-            steps=[
-                {"label": "Build", "status": "complete", "detail": "Compiled in 2.3s"},
-                {"label": "Test", "status": "complete", "detail": "42 tests passed"},
-                {"label": "Deploy", "status": "running", "detail": "Uploading..."},
-                {"label": "Verify", "status": "pending"},
-            ],
-        )
-        await asyncio.sleep(1.5)
-
-        # Test 5: Code
-        print("→ Showing code block...")
-        await bridge.send_code(
-            code='''def hello_world():
+"""
+
+_TABLE = UITable(
+    title="Cloud Costs",
+    columns=["Service", "Tier", "Monthly Cost"],
+    rows=[
+        ["EC2", "t3.medium", "$30.00"],
+        ["RDS", "db.t3.small", "$25.00"],
+        ["S3", "Standard", "$5.00"],
+        ["Lambda", "1M reqs", "$2.00"],
+    ],
+    footer="Total: $60/month",
+)
+
+_PROGRESS = UIProgress(
+    message="Deploying application...",
+    percent=65.0,
+    steps=[
+        UIProgressStep("Build", "complete", "Compiled in 2.3s"),
+        UIProgressStep("Test", "complete", "42 tests passed"),
+        UIProgressStep("Deploy", "running", "Uploading..."),
+        UIProgressStep("Verify", "pending"),
+    ],
+)
+
+_CODE = UICode(
+    code='''def hello_world():
     """A simple function."""
     print("Hello, World!")
     return 42
@@ -96,14 +63,44 @@ Testing the **{theme}** theme with various UI components.
 if __name__ == "__main__":
     result = hello_world()
     print(f"Result: {result}")''',
-            language="python",
-            title="Python Example",
-        )
-        await asyncio.sleep(1.5)
-
-        # Test 6: Final message
-        print("→ Sending completion message...")
-        await bridge.send_text(f"✨ Theme test complete for {theme_name}!", done=True)
+    language="python",
+    title="Python Example",
+)
+
+_RULE = "=" * 60
+
+_SUITE_BANNER = "\n🎨 AgentUI - Charm Theme Test Suite\nTesting all Charm themes...\n\n"
+_SUITE_DONE = f"\n{_RULE}\nAll theme tests complete!\n{_RULE}\n\n"
+
+
+async def test_theme(theme_name: str):
+    """Test a theme by showing various UI elements."""
+
+    sys.stdout.write(f"\n{_RULE}\nTesting theme: {theme_name}\n{_RULE}\n\n")
+
+    # Create TUI config
+    tui_config = TUIConfig(
+        theme=theme_name,
+        app_name="Theme Test",
+        tagline=f"Testing {theme_name}",
+        debug=False,
+    )
+
+    # Use managed bridge context
+    async with managed_bridge(tui_config, fallback=True) as bridge:
+        # Every component goes out in a single pipe write
+        print("→ Sending text, markdown, table, progress, and code...")
+        await bridge.send_batch([
+            UIText("Welcome to AgentUI Theme Test!"),
+            UIMarkdown(_MARKDOWN_TEMPLATE.format(theme=theme_name), title="Theme Documentation"),
+            _TABLE,
+            _PROGRESS,
+            _CODE,
+            UIText(f"✨ Theme test complete for {theme_name}!", done=True),
+        ])
+        await bridge.flush()
+
+        # Hold the finished screen so the theme can be inspected before the TUI closes
         await asyncio.sleep(2)
 
     print(f"\n✓ Theme {theme_name} tested successfully!\n")
@@ -119,8 +116,7 @@ async def main():
         await test_theme(theme)
     else:
         # Test all Charm themes
-        print("\n🎨 AgentUI - Charm Theme Test Suite")
-        print("Testing all Charm themes...\n")
+        sys.stdout.write(_SUITE_BANNER)
 
         for theme in themes:
             try:
@@ -132,9 +128,7 @@ async def main():
             except Exception as e:
                 print(f"\n✗ Error testing {theme}: {e}\n")
 
-        print("\n" + "="*60)
-        print("All theme tests complete!")
-        print("="*60 + "\n")
+        sys.stdout.write(_SUITE_DONE)
 
 
 if __name__ == "__main__":
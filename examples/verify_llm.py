@@ -15,6 +15,7 @@ Run:
 import asyncio
 import os
 from agentui import AgentApp, UICode
+from _code_samples import GO_HELLO, PYTHON_HELLO
 
 
 if not os.environ.get("ANTHROPIC_API_KEY"):
@@ -38,6 +39,12 @@ Be very brief - just show the code, no extra explanation.""",
 )
 
 
+_CODE = {
+    "python": UICode(title="Python Example", language="python", code=PYTHON_HELLO),
+    "go": UICode(title="Go Example", language="go", code=GO_HELLO),
+}
+
+
 @app.ui_tool(
     name="show_code",
     description="Show syntax-highlighted code",
@@ -51,33 +58,14 @@ Be very brief - just show the code, no extra explanation.""",
 )
 def show_code(language: str) -> UICode:
     """Return a simple code example."""
-
-    if language == "python":
-        code = '''def hello(name: str) -> str:
-    """Greet someone."""
-    return f"Hello, {name}!"
-
-# Usage
-message = hello("World")
-print(message)'''
-    else:  # go
-        code = '''package main
-
-import "fmt"
-
-func hello(name string) string {
-    return fmt.Sprintf("Hello, %s!", name)
-}
-
-func main() {
-    message := hello("World")
-    fmt.Println(message)
-}'''
+    cached = _CODE.get(language)
+    if cached is not None:
+        return cached
 
     return UICode(
         title=f"{language.title()} Example",
         language=language,
-        code=code,
+        code=GO_HELLO,
     )
 
 
@@ -799,6 +799,13 @@ func (m Model) handleProtocolMsg(msg *protocol.Message) (tea.Model, tea.Cmd) {
 		})
 		m.viewport.SetContent(m.renderMessages())
 		m.viewport.GotoBottom()
+
+	case protocol.TypeFlush:
+		// Messages are handled in order, so everything sent before the marker
+		// has already been applied to the model
+		if err := m.handler.SendFlushAck(msg.ID); err != nil {
+			m.setError("Failed to send flush ack", err.Error(), false)
+		}
 	}
 
 	return m, m.listenForMessages()
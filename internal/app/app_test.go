@@ -0,0 +1,37 @@
+package app
+
+import (
+	"bytes"
+	"encoding/json"
+	"strings"
+	"testing"
+
+	"github.com/flight505/agentui/internal/protocol"
+)
+
+func TestHandleProtocolMsgFlushSendsAck(t *testing.T) {
+	var out bytes.Buffer
+	handler := protocol.NewHandler(strings.NewReader(""), &out)
+	m := NewModel(handler, "Test", "Testing")
+
+	msg, err := protocol.NewMessageWithID(protocol.TypeFlush, "flush-1", nil)
+	if err != nil {
+		t.Fatalf("NewMessageWithID failed: %v", err)
+	}
+
+	updated, _ := m.handleProtocolMsg(msg)
+
+	var ack protocol.Message
+	if err := json.Unmarshal(out.Bytes(), &ack); err != nil {
+		t.Fatalf("Expected a flush ack on the writer, got %q: %v", out.String(), err)
+	}
+	if ack.Type != protocol.TypeFlushAck {
+		t.Errorf("Ack type = %s, want %s", ack.Type, protocol.TypeFlushAck)
+	}
+	if ack.ID != "flush-1" {
+		t.Errorf("Ack ID = %q, want %q", ack.ID, "flush-1")
+	}
+	if got := updated.(Model).lastError; got != nil {
+		t.Errorf("Flush should not set an error, got %q", got.Message)
+	}
+}
@@ -174,6 +174,12 @@ func (h *Handler) SendSelectResponse(id string, value string) error {
 	return h.SendSync(msg)
 }
 
+// SendFlushAck acknowledges a flush marker.
+func (h *Handler) SendFlushAck(id string) error {
+	msg, _ := NewMessageWithID(TypeFlushAck, id, nil)
+	return h.SendSync(msg)
+}
+
 // SendQuit sends quit message.
 func (h *Handler) SendQuit() error {
 	msg, _ := NewMessage(TypeQuit, nil)
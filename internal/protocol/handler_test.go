@@ -0,0 +1,46 @@
+package protocol
+
+import (
+	"bytes"
+	"encoding/json"
+	"strings"
+	"testing"
+)
+
+func TestFlushAckRoundTrip(t *testing.T) {
+	// The Python bridge sends a flush marker as a request with an ID
+	in := strings.NewReader(`{"type":"flush","id":"flush-1"}` + "\n")
+	var out bytes.Buffer
+
+	h := NewHandler(in, &out)
+	h.Start()
+	defer h.Stop()
+
+	msg, ok := <-h.Incoming()
+	if !ok {
+		t.Fatal("Incoming closed before the flush marker was read")
+	}
+	if msg.Type != TypeFlush {
+		t.Fatalf("Type = %s, want %s", msg.Type, TypeFlush)
+	}
+
+	if err := h.SendFlushAck(msg.ID); err != nil {
+		t.Fatalf("SendFlushAck failed: %v", err)
+	}
+
+	line := out.String()
+	if !strings.HasSuffix(line, "\n") {
+		t.Errorf("Ack %q should be newline-terminated", line)
+	}
+
+	var ack Message
+	if err := json.Unmarshal([]byte(line), &ack); err != nil {
+		t.Fatalf("Ack is not valid JSON: %v", err)
+	}
+	if ack.Type != TypeFlushAck {
+		t.Errorf("Ack type = %s, want %s", ack.Type, TypeFlushAck)
+	}
+	if ack.ID != "flush-1" {
+		t.Errorf("Ack ID = %q, want %q", ack.ID, "flush-1")
+	}
+}
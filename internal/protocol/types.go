@@ -25,6 +25,7 @@ const (
 	TypeDone     MessageType = "done"
 	TypeUpdate   MessageType = "update" // Phase 3: Progressive streaming
 	TypeLayout   MessageType = "layout" // Phase 5: Multi-component layouts
+	TypeFlush    MessageType = "flush"  // Acknowledged once every earlier message is handled
 )
 
 // Message types from Go → Python (user events)
@@ -36,6 +37,7 @@ const (
 	TypeCancel          MessageType = "cancel"
 	TypeQuit            MessageType = "quit"
 	TypeResize          MessageType = "resize"
+	TypeFlushAck        MessageType = "flush_ack"
 )
 
 // Message is the base message structure for all protocol communication.
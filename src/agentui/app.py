@@ -121,6 +121,7 @@ class AgentApp:
         max_tokens: int = 4096,
         temperature: float = 0.7,
         system_prompt: str | None = None,
+        prompt_cache: bool = True,
         theme: str = "catppuccin-mocha",
         tagline: str = "AI Agent Interface",
         debug: bool = False,
@@ -132,6 +133,10 @@ class AgentApp:
         is provided, configuration values are loaded from it and merged with
         constructor arguments (constructor args take precedence).
 
+        Construction is cheap enough to do at module import: the AgentCore,
+        the LLM provider client, and the UI bridge are all created lazily by
+        the first call to run() or chat().
+
         Args:
             name: Application name used for identification
             manifest: Path to app.yaml file, directory containing app.yaml,
@@ -147,6 +152,9 @@ class AgentApp:
                 produce more random outputs
             system_prompt: System prompt that defines agent behavior. If None,
                 uses manifest system_prompt or default
+            prompt_cache: Send the system prompt with an ephemeral cache_control
+                breakpoint so repeat turns read it from Anthropic's prompt
+                cache. Only used by the Claude provider
             theme: UI theme name for the TUI (e.g., "catppuccin-mocha", "charm-dark")
             tagline: Tagline displayed in the UI header
             debug: Enable debug logging to stderr
@@ -186,6 +194,7 @@ class AgentApp:
                 or self.manifest.system_prompt
                 or "You are a helpful AI assistant."
             ),
+            prompt_cache=prompt_cache,
             theme=theme,
             app_name=self.manifest.display_name or name,
             tagline=tagline or self.manifest.tagline,
@@ -250,6 +259,7 @@ class AgentApp:
         parameters: dict[str, Any],
         is_ui_tool: bool = False,
         requires_confirmation: bool = False,
+        cacheable: bool = False,
     ) -> Callable:
         """
         Decorator to register a tool.
@@ -260,6 +270,9 @@ class AgentApp:
             parameters: JSON schema for parameters
             is_ui_tool: If True, tool returns UI primitives
             requires_confirmation: If True, asks user before executing
+            cacheable: If True, the tool is pure and a repeated call with the
+                same arguments returns the earlier result without running it.
+                Calls to it from one response may also run concurrently.
 
         Example:
             @app.tool(
@@ -284,6 +297,7 @@ class AgentApp:
                 handler=func,
                 is_ui_tool=is_ui_tool,
                 requires_confirmation=requires_confirmation,
+                cacheable=cacheable,
             )
             self._tools.append(tool_def)
             logger.debug(f"Registered tool: {name}")
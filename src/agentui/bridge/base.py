@@ -12,11 +12,16 @@ The BaseBridge interface defines methods for:
 """
 
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Sequence
 from typing import Literal
 
+from agentui.exceptions import ValidationError
+from agentui.primitives import UIAlert, UICode, UIMarkdown, UIProgress, UITable, UIText
 from agentui.protocol import Message
 
+# Display primitives that can be sent together with send_batch()
+BatchPrimitive = UIText | UIMarkdown | UITable | UIProgress | UICode | UIAlert
+
 
 class BaseBridge(ABC):
     """
@@ -275,3 +280,48 @@ class BaseBridge(ABC):
             summary: Optional completion summary
         """
         pass
+
+    async def flush(self) -> None:
+        """
+        Wait until the UI has handled every message sent so far.
+
+        Use this instead of fixed sleeps when pacing output. Bridges that
+        render synchronously have nothing to wait for, so the default
+        returns immediately.
+        """
+        pass
+
+    async def send_batch(self, primitives: Sequence[BatchPrimitive]) -> None:
+        """
+        Send several display primitives in order.
+
+        The default sends each one through its send_* method. TUIBridge
+        overrides this to write the whole batch to the pipe at once.
+
+        Args:
+            primitives: Display primitives to show, in order
+
+        Raises:
+            ValidationError: If a primitive is not a display primitive
+        """
+        for primitive in primitives:
+            if isinstance(primitive, UIText):
+                await self.send_text(primitive.content, done=primitive.done)
+            elif isinstance(primitive, UIMarkdown):
+                await self.send_markdown(primitive.content, primitive.title)
+            elif isinstance(primitive, UITable):
+                await self.send_table(
+                    primitive.columns, primitive.rows, primitive.title, primitive.footer
+                )
+            elif isinstance(primitive, UIProgress):
+                await self.send_progress(
+                    primitive.message,
+                    primitive.percent,
+                    [s.to_dict() for s in primitive.steps] if primitive.steps else None,
+                )
+            elif isinstance(primitive, UICode):
+                await self.send_code(primitive.code, primitive.language, primitive.title)
+            elif isinstance(primitive, UIAlert):
+                await self.send_alert(primitive.message, primitive.severity, primitive.title)
+            else:
+                raise ValidationError(f"Cannot batch {type(primitive).__name__}")
@@ -5,14 +5,15 @@ import json
 import logging
 import shutil
 import subprocess
-from collections.abc import AsyncGenerator, AsyncIterator
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Sequence
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Any, Literal
 
-from agentui.bridge.base import BaseBridge
+from agentui.bridge.base import BaseBridge, BatchPrimitive
 from agentui.config import TUIConfig
 from agentui.exceptions import ConnectionError, ProtocolError, ValidationError
+from agentui.primitives import UIAlert, UICode, UIMarkdown, UIProgress, UITable, UIText
 from agentui.protocol import (
     Message,
     MessageType,
@@ -35,6 +36,16 @@ from agentui.protocol import (
 
 logger = logging.getLogger(__name__)
 
+# Message type for each primitive accepted by send_batch()
+_BATCH_MESSAGE_TYPES: dict[type, MessageType] = {
+    UIText: MessageType.TEXT,
+    UIMarkdown: MessageType.MARKDOWN,
+    UITable: MessageType.TABLE,
+    UIProgress: MessageType.PROGRESS,
+    UICode: MessageType.CODE,
+    UIAlert: MessageType.ALERT,
+}
+
 
 class TUIBridge(BaseBridge):
     """
@@ -54,7 +65,7 @@ class TUIBridge(BaseBridge):
         self._writer_task: asyncio.Task | None = None
         self._pending_requests: dict[str, asyncio.Future] = {}
         self._event_queue: asyncio.Queue[Message] = asyncio.Queue()
-        self._outgoing_queue: asyncio.Queue[Message] = asyncio.Queue()
+        self._outgoing_queue: asyncio.Queue[Message | list[Message]] = asyncio.Queue()
         self._running = False
         self._shutting_down = False
         self._lock = asyncio.Lock()
@@ -120,6 +131,7 @@ class TUIBridge(BaseBridge):
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                encoding="utf-8",
                 bufsize=1,
             )
         except OSError as e:
@@ -289,12 +301,15 @@ class TUIBridge(BaseBridge):
         logger.error("Failed to reconnect to TUI")
         self._running = False
 
-    async def _send_raw(self, message: Message) -> None:
-        """Send a message directly to TUI stdin."""
+    async def _send_raw(self, message: Message | list[Message]) -> None:
+        """Send a message, or a batch of messages in one write, directly to TUI stdin."""
         if not self._process or not self._process.stdin:
             raise ConnectionError("TUI not connected")
 
-        line = message.to_json() + "\n"
+        if isinstance(message, list):
+            line = "".join(m.to_json() + "\n" for m in message)
+        else:
+            line = message.to_json() + "\n"
 
         if self.config.debug:
             logger.debug(f"→ TUI: {line[:100]}...")
@@ -313,6 +328,27 @@ class TUIBridge(BaseBridge):
             raise ConnectionError("TUI not running")
         await self._outgoing_queue.put(message)
 
+    async def send_batch(self, primitives: Sequence[BatchPrimitive]) -> None:
+        """Queue display primitives to be written to the TUI in a single write."""
+        messages = []
+        for primitive in primitives:
+            # Walk the MRO so subclasses batch the same way isinstance dispatch allows
+            msg_type = next(
+                (
+                    _BATCH_MESSAGE_TYPES[cls]
+                    for cls in type(primitive).__mro__
+                    if cls in _BATCH_MESSAGE_TYPES
+                ),
+                None,
+            )
+            if msg_type is None:
+                raise ValidationError(f"Cannot batch {type(primitive).__name__}")
+            messages.append(create_message(msg_type, primitive.to_dict()))
+
+        if not self._running:
+            raise ConnectionError("TUI not running")
+        await self._outgoing_queue.put(messages)
+
     async def send_sync(self, message: Message) -> None:
         """Send a message synchronously (bypass queue)."""
         if not self._running:
@@ -321,6 +357,24 @@ class TUIBridge(BaseBridge):
 
     async def request(self, message: Message, timeout: float = 30.0) -> Any:
         """Send a request and wait for response."""
+        return await self._request_via(self._send_raw, message, timeout)
+
+    async def flush(self, timeout: float = 5.0) -> None:
+        """
+        Wait until the TUI has handled every message sent so far.
+
+        The flush marker is queued behind earlier sends, and the TUI
+        acknowledges it once those messages have been applied.
+        """
+        await self._request_via(self.send, create_request(MessageType.FLUSH), timeout)
+
+    async def _request_via(
+        self,
+        send: Callable[[Message], Awaitable[None]],
+        message: Message,
+        timeout: float,
+    ) -> Any:
+        """Send a request with the given sender and wait for its response."""
         if not message.id:
             raise ValidationError("Request must have an ID")
 
@@ -331,7 +385,7 @@ class TUIBridge(BaseBridge):
         self._pending_requests[message.id] = future
 
         try:
-            await self._send_raw(message)
+            await send(message)
             return await asyncio.wait_for(future, timeout=timeout)
         except TimeoutError:
             self._pending_requests.pop(message.id, None)
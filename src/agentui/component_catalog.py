@@ -9,12 +9,14 @@ request pre-approved components. The catalog provides:
 - Selection heuristics for intelligent component choice
 """
 
+import functools
 
 
 class ComponentCatalog:
     """Component catalog for LLM discovery and intelligent selection."""
 
     @staticmethod
+    @functools.cache
     def get_catalog_prompt() -> str:
         """
         Generate component catalog documentation for system prompt.
@@ -235,10 +237,19 @@ choice = display_select(
         These schemas follow the Anthropic/OpenAI tool calling format.
         Each display_* tool renders a UI component.
 
+        The schemas are built once per process and shared by every agent;
+        each call returns a new list of the same (read-only) schema dicts.
+
         Returns:
             List of tool schemas for LLM tool calling
         """
-        return [
+        return list(ComponentCatalog._build_tool_schemas())
+
+    @staticmethod
+    @functools.cache
+    def _build_tool_schemas() -> tuple[dict, ...]:
+        """Build the display_* tool schemas."""
+        return (
             {
                 "name": "display_table",
                 "description": (
@@ -431,4 +442,4 @@ choice = display_select(
                     "required": ["label", "options"]
                 }
             }
-        ]
+        )
@@ -30,6 +30,7 @@ class AgentConfig:
         api_key: API key for the provider (loaded from env if None)
         max_tokens: Maximum tokens for responses
         temperature: Temperature for generation (0.0-1.0)
+        prompt_cache: Mark the system prompt as a prompt-cache breakpoint (Claude only)
         system_prompt: System prompt for the agent
         max_tool_iterations: Maximum tool execution iterations
         theme: UI theme name
@@ -43,6 +44,7 @@ class AgentConfig:
     api_key: str | None = None
     max_tokens: int = 4096
     temperature: float = 0.7
+    prompt_cache: bool = True
 
     # System prompt
     system_prompt: str = "You are a helpful AI assistant."
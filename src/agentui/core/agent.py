@@ -177,6 +177,7 @@ class AgentCore:
                     model=self.config.model,
                     api_key=self.config.api_key,
                     max_tokens=self.config.max_tokens,
+                    prompt_cache=self.config.prompt_cache,
                 )
             elif provider_name == "openai":
                 from agentui.providers.openai import OpenAIProvider
@@ -274,34 +275,62 @@ class AgentCore:
             yield StreamChunk(content=response_text, is_complete=True)
 
     async def _execute_and_record_tools(self, tool_calls: list[dict]) -> None:
-        """Execute tool calls and add results to message state."""
-        tool_results = []
+        """
+        Execute tool calls and add results to message state.
+
+        Calls run in the order the model requested them. Consecutive calls
+        to pure tools (see ToolExecutor.can_run_concurrently) are grouped and
+        run concurrently, so their latencies overlap; every other call,
+        including the interactive display_* tools and tools that ask for
+        confirmation, runs on its own. Each group's UI results are rendered
+        in order before the next group starts.
+        """
+        tool_results: list[ToolResult] = []
 
-        for call in tool_calls:
+        for group in self._group_tool_calls(tool_calls):
             if self.message_handler.is_cancelled():
                 break
 
-            result = await self.execute_tool(
-                tool_name=call["name"],
-                tool_id=call["id"],
-                arguments=call.get("input", {}),
+            executed = await asyncio.gather(
+                *(
+                    self.execute_tool(
+                        tool_name=call["name"],
+                        tool_id=call["id"],
+                        arguments=call.get("input", {}),
+                    )
+                    for call in group
+                )
             )
 
-            # Handle UI results
-            if result.is_ui and result.result:
-                ui_response = await self.handle_ui_result(result.result)
-                if ui_response is not None:
-                    result = ToolResult(
-                        tool_name=result.tool_name,
-                        tool_id=result.tool_id,
-                        result=ui_response,
-                    )
+            for result in executed:
+                # Handle UI results
+                if result.is_ui and result.result:
+                    ui_response = await self.handle_ui_result(result.result)
+                    if ui_response is not None:
+                        result = ToolResult(
+                            tool_name=result.tool_name,
+                            tool_id=result.tool_id,
+                            result=ui_response,
+                        )
 
-            tool_results.append(result)
+                tool_results.append(result)
 
         # Add tool results to messages
         self.message_handler.add_tool_results(tool_results)
 
+    def _group_tool_calls(self, tool_calls: list[dict]) -> list[list[dict]]:
+        """Split tool calls into in-order groups that may each run concurrently."""
+        groups: list[list[dict]] = []
+        extend_last = False
+        for call in tool_calls:
+            concurrent = self.tool_executor.can_run_concurrently(call["name"])
+            if concurrent and extend_last:
+                groups[-1].append(call)
+            else:
+                groups.append([call])
+            extend_last = concurrent
+        return groups
+
     def cancel(self) -> None:
         """Request cancellation of current processing."""
         self.message_handler.request_cancel()
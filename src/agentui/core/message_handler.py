@@ -116,6 +116,10 @@ class MessageHandler:
             self.state.total_input_tokens += chunk["input_tokens"]
         if chunk.get("output_tokens"):
             self.state.total_output_tokens += chunk["output_tokens"]
+        if chunk.get("cache_creation_input_tokens"):
+            self.state.total_cache_creation_tokens += chunk["cache_creation_input_tokens"]
+        if chunk.get("cache_read_input_tokens"):
+            self.state.total_cache_read_tokens += chunk["cache_read_input_tokens"]
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to the state."""
@@ -5,7 +5,9 @@ Manages tool registration, execution, confirmation, and component selection.
 """
 
 import asyncio
+import json
 import logging
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any
 
@@ -26,6 +28,9 @@ from agentui.types import ToolDefinition, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of cached results kept for cacheable tools
+_RESULT_CACHE_SIZE = 256
+
 
 class ToolExecutor:
     """Handles tool execution and result processing."""
@@ -38,6 +43,9 @@ class ToolExecutor:
         """
         self.tools: dict[str, ToolDefinition] = {}
         self._bridge_getter = bridge_getter
+        self._tool_schemas: list[dict] | None = None
+        # (tool name, canonical arguments) -> (result, is_ui) for cacheable tools
+        self._result_cache: OrderedDict[tuple[str, str], tuple[Any, bool]] = OrderedDict()
 
     @property
     def bridge(self) -> Any:
@@ -47,11 +55,29 @@ class ToolExecutor:
     def register_tool(self, tool: ToolDefinition) -> None:
         """Register a tool for execution."""
         self.tools[tool.name] = tool
+        self._tool_schemas = None
+        self._result_cache.clear()
         logger.debug(f"Registered tool: {tool.name}")
 
     def get_tool_schemas(self) -> list[dict]:
-        """Get tool schemas for the LLM."""
-        return [tool.to_schema() for tool in self.tools.values()]
+        """Get tool schemas for the LLM.
+
+        The list is built once and reused on every LLM turn until another
+        tool is registered.
+        """
+        if self._tool_schemas is None:
+            self._tool_schemas = [tool.to_schema() for tool in self.tools.values()]
+        return self._tool_schemas
+
+    def can_run_concurrently(self, tool_name: str) -> bool:
+        """Check whether a call may overlap other calls from the same response.
+
+        Only pure tools qualify: ones marked cacheable that don't ask for
+        confirmation. Anything else may have side effects or open a modal
+        (the display_* tools), so it runs on its own, in request order.
+        """
+        tool = self.tools.get(tool_name)
+        return tool is not None and tool.cacheable and not tool.requires_confirmation
 
     async def execute_tool(
         self, tool_name: str, tool_id: str, arguments: dict
@@ -63,6 +89,19 @@ class ToolExecutor:
             )
 
         tool = self.tools[tool_name]
+
+        cache_key = self._result_cache_key(tool, arguments)
+        if cache_key is not None and cache_key in self._result_cache:
+            self._result_cache.move_to_end(cache_key)
+            result, is_ui = self._result_cache[cache_key]
+            logger.debug(f"Tool {tool_name} served from cache")
+            return ToolResult(
+                tool_name=tool_name,
+                tool_id=tool_id,
+                result=result,
+                is_ui=is_ui,
+            )
+
         logger.debug(f"Executing tool: {tool_name} with args: {arguments}")
 
         # Check if confirmation is required
@@ -80,6 +119,11 @@ class ToolExecutor:
 
             logger.debug(f"Tool {tool_name} completed successfully")
 
+            if cache_key is not None:
+                self._result_cache[cache_key] = (result, is_ui)
+                if len(self._result_cache) > _RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+
             return ToolResult(
                 tool_name=tool_name,
                 tool_id=tool_id,
@@ -91,6 +135,16 @@ class ToolExecutor:
             logger.error(f"Tool {tool_name} execution failed: {e}")
             return self._create_error_result(tool_name, tool_id, str(e))
 
+    def _result_cache_key(self, tool: ToolDefinition, arguments: dict) -> tuple[str, str] | None:
+        """Build the result cache key for a cacheable tool call."""
+        if not tool.cacheable:
+            return None
+
+        try:
+            return tool.name, json.dumps(arguments, sort_keys=True)
+        except (TypeError, ValueError):
+            return None  # Arguments that can't be canonicalized aren't cached
+
     def _create_error_result(
         self, tool_name: str, tool_id: str, error: str
     ) -> ToolResult:
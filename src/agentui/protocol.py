@@ -10,6 +10,13 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Literal
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    _HAS_ORJSON = False
+
 
 class MessageType(str, Enum):
     """Message types for the protocol."""
@@ -29,6 +36,7 @@ class MessageType(str, Enum):
     DONE = "done"
     UPDATE = "update"  # Phase 3: Progressive streaming - update existing component
     LAYOUT = "layout"  # Phase 5: Multi-component layouts
+    FLUSH = "flush"  # Acknowledged once every earlier message is handled
 
     # Go → Python (user events)
     INPUT = "input"
@@ -38,6 +46,7 @@ class MessageType(str, Enum):
     CANCEL = "cancel"
     QUIT = "quit"
     RESIZE = "resize"
+    FLUSH_ACK = "flush_ack"
 
 
 @dataclass
@@ -54,12 +63,20 @@ class Message:
             data["id"] = self.id
         if self.payload:
             data["payload"] = self.payload
-        return json.dumps(data)
+        if _HAS_ORJSON:
+            encoded: bytes = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+            return encoded.decode()
+        # Same separators, raw non-ASCII and int/float/None key coercion as
+        # orjson, so typical payloads encode to the same line. The encoders
+        # still differ elsewhere: json writes NaN/Infinity where orjson writes
+        # null, formats some floats differently (1e-07 vs 1e-7), and accepts
+        # ints beyond 64 bits that orjson rejects with TypeError.
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
 
     @classmethod
     def from_json(cls, line: str) -> "Message":
         """Deserialize from JSON line."""
-        data = json.loads(line)
+        data = orjson.loads(line) if _HAS_ORJSON else json.loads(line)
         return cls(
             type=data.get("type", ""),
             id=data.get("id"),
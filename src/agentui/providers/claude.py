@@ -22,10 +22,12 @@ class ClaudeProvider:
         model: str | None = None,
         api_key: str | None = None,
         max_tokens: int = 4096,
+        prompt_cache: bool = True,
     ):
         self.model = model or self.DEFAULT_MODEL
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.max_tokens = max_tokens
+        self.prompt_cache = prompt_cache
         self._client = None
 
     def _get_client(self) -> object:
@@ -98,13 +100,26 @@ class ClaudeProvider:
         }
 
         if system:
-            request["system"] = system
+            request["system"] = self._build_system(system)
 
         if tools:
             request["tools"] = self._convert_tools(tools)
 
         return request
 
+    def _build_system(self, system: str) -> str | list[dict]:
+        """Build the system field, marking it as a cache breakpoint if enabled."""
+        if not self.prompt_cache:
+            return system
+
+        return [
+            {
+                "type": "text",
+                "text": system,
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
     def _stream_sync(self, client: object, request: dict) -> list[object]:
         """Synchronous streaming helper for executor."""
         with client.messages.stream(**request) as stream:  # type: ignore[attr-defined]
@@ -196,6 +211,8 @@ class ClaudeProvider:
             "type": "message_end",
             "input_tokens": getattr(usage, "input_tokens", 0),
             "output_tokens": getattr(usage, "output_tokens", 0),
+            "cache_creation_input_tokens": getattr(usage, "cache_creation_input_tokens", None) or 0,
+            "cache_read_input_tokens": getattr(usage, "cache_read_input_tokens", None) or 0,
         }
 
     def _convert_messages(self, messages: list[dict]) -> list[dict]:
@@ -232,8 +249,14 @@ class ClaudeProvider:
         return result
 
     def _convert_tools(self, tools: list[dict]) -> list[dict]:
-        """Convert tools to Anthropic format."""
-        return [
+        """Convert tools to Anthropic format.
+
+        Tools keep their registration order so the prefix is identical on
+        every turn. With prompt caching enabled the last tool carries a cache
+        breakpoint, which caches the tool block even if the system prompt
+        changes.
+        """
+        result = [
             {
                 "name": tool["name"],
                 "description": tool["description"],
@@ -241,3 +264,8 @@ class ClaudeProvider:
             }
             for tool in tools
         ]
+
+        if self.prompt_cache and result:
+            result[-1]["cache_control"] = {"type": "ephemeral"}
+
+        return result
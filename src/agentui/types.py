@@ -46,6 +46,9 @@ class ToolDefinition:
         handler: Sync or async function that executes the tool
         is_ui_tool: If True, handler returns UI primitives instead of data
         requires_confirmation: If True, prompts user before execution
+        cacheable: If True, the handler is a pure function of its arguments
+            and repeated calls with the same arguments reuse the first result;
+            calls to it from one response may also run concurrently
 
     Example:
         >>> def get_weather(city: str) -> dict:
@@ -70,6 +73,7 @@ class ToolDefinition:
     handler: Callable[..., Any] | Callable[..., Awaitable[Any]]
     is_ui_tool: bool = False  # If True, returns UI primitives
     requires_confirmation: bool = False
+    cacheable: bool = False
 
     def to_schema(self) -> dict:
         """
@@ -138,12 +142,16 @@ class AgentState:
         current_tool: Name of tool currently being executed (if any)
         total_input_tokens: Total input tokens used in conversation
         total_output_tokens: Total output tokens generated in conversation
+        total_cache_creation_tokens: Input tokens written to the prompt cache
+        total_cache_read_tokens: Input tokens served from the prompt cache
     """
     messages: list[Message] = field(default_factory=list)
     is_running: bool = False
     current_tool: str | None = None
     total_input_tokens: int = 0
     total_output_tokens: int = 0
+    total_cache_creation_tokens: int = 0
+    total_cache_read_tokens: int = 0
 
 
 @dataclass
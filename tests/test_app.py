@@ -2,9 +2,9 @@
 Tests for the app module (AgentApp).
 """
 
-import os
-import tempfile
-from pathlib import Path
+import re
+from collections import namedtuple
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -13,50 +13,86 @@ import yaml
 from agentui.app import AgentApp, create_app, quick_chat
 from agentui.types import AgentConfig, AppManifest, ProviderType, ToolDefinition
 
+# Streamed chunks are only read for attributes, so a plain tuple stands in
+_Chunk = namedtuple("_Chunk", "content is_complete")
+
+_MANIFEST_NOT_FOUND_RE = re.compile("Manifest not found")
+
 
 @pytest.fixture
-def mock_api_key():
+def mock_api_key(monkeypatch):
     """Set up a mock API key for testing."""
-    old_key = os.environ.get("ANTHROPIC_API_KEY")
-    os.environ["ANTHROPIC_API_KEY"] = "test-api-key-12345"
-    yield "test-api-key-12345"
-    if old_key:
-        os.environ["ANTHROPIC_API_KEY"] = old_key
-    else:
-        os.environ.pop("ANTHROPIC_API_KEY", None)
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-api-key-12345")
+    return "test-api-key-12345"
+
+
+@pytest.fixture
+def patched_core():
+    """Patch AgentCore and yield the class mock with the core it returns."""
+    with patch("agentui.app.AgentCore") as MockCore:
+        # chat() only touches these two attributes; tests set process_message
+        mock_core = SimpleNamespace(register_tool=MagicMock(), process_message=None)
+        MockCore.return_value = mock_core
+        yield MockCore, mock_core
+
+
+@pytest.fixture(scope="module")
+def make_app():
+    """Return a factory for the default test app."""
+    def _make():
+        return AgentApp(name="TestAgent")
+    return _make
 
 
 @pytest.fixture
-def temp_manifest_file():
-    """Create a temporary manifest file for testing."""
-    manifest_data = {
-        "name": "test-agent",
-        "version": "1.0.0",
-        "description": "Test agent",
-        "display_name": "Test Agent",
-        "tagline": "Testing manifest",
-        "system_prompt": "You are a test assistant.",
-        "providers": {
-            "default": "claude",
-            "claude": {
-                "model": "claude-3-sonnet-20240229",
-            }
-        }
-    }
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        manifest_path = Path(tmpdir) / "app.yaml"
-        with open(manifest_path, "w") as f:
-            yaml.dump(manifest_data, f)
-        yield manifest_path
+def app(mock_api_key, make_app):
+    """Provide a fresh default app for tests that register tools or chat."""
+    return make_app()
+
+
+@pytest.fixture(scope="module")
+def default_app(make_app):
+    """Build one default app for tests that only read its initial state."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("ANTHROPIC_API_KEY", "test-api-key-12345")
+        return make_app()
+
+
+# Manifest contents are constant, so they are kept pre-serialized
+_MANIFEST_YAML = """\
+name: test-agent
+version: 1.0.0
+description: Test agent
+display_name: Test Agent
+tagline: Testing manifest
+system_prompt: You are a test assistant.
+providers:
+  default: claude
+  claude:
+    model: claude-3-sonnet-20240229
+"""
+
+
+@pytest.fixture(scope="session")
+def temp_manifest_file(tmp_path_factory):
+    """Create a temporary manifest file shared by the read-only manifest tests."""
+    manifest_path = tmp_path_factory.mktemp("manifest") / "app.yaml"
+    manifest_path.write_text(_MANIFEST_YAML)
+    return manifest_path
+
+
+@pytest.fixture(scope="session")
+def parsed_manifest(temp_manifest_file):
+    """Parse the shared manifest once for tests that only need its contents."""
+    return AppManifest.from_dict(yaml.safe_load(temp_manifest_file.read_text()))
 
 
 class TestAgentAppInitialization:
     """Tests for AgentApp initialization."""
 
-    def test_default_initialization(self, mock_api_key):
+    def test_default_initialization(self, default_app):
         """Test AgentApp initializes with correct defaults."""
-        app = AgentApp(name="TestAgent")
+        app = default_app
 
         assert app.config.app_name == "TestAgent"
         assert app.config.provider == ProviderType.CLAUDE
@@ -68,7 +104,20 @@ class TestAgentAppInitialization:
         assert app._core is None
         assert app._bridge is None
 
-    def test_custom_initialization(self, mock_api_key):
+    def test_initialization_is_lazy(self, patched_core):
+        """Test AgentApp defers core and provider setup until first use."""
+        MockCore, _ = patched_core
+        app = AgentApp(name="TestAgent")
+
+        @app.tool(name="noop", description="No-op", parameters={})
+        def noop():
+            return None
+
+        MockCore.assert_not_called()
+        assert app._core is None
+        assert app._bridge is None
+
+    def test_custom_initialization(self):
         """Test AgentApp initializes with custom parameters."""
         app = AgentApp(
             name="CustomAgent",
@@ -111,7 +160,16 @@ class TestAgentAppInitialization:
         assert app.manifest.name == "test-agent"
         assert app.config.app_name == "Test Agent"
 
-    def test_manifest_initialization_from_object(self, mock_api_key):
+    def test_manifest_initialization_from_parsed_manifest(self, parsed_manifest):
+        """Test AgentApp derives its config from an already parsed manifest."""
+        app = AgentApp(manifest=parsed_manifest)
+
+        assert app.manifest is parsed_manifest
+        assert app.config.app_name == "Test Agent"
+        assert app.config.system_prompt == "You are a test assistant."
+        assert app.config.model == "claude-3-sonnet-20240229"
+
+    def test_manifest_initialization_from_object(self):
         """Test AgentApp initializes from AppManifest object."""
         manifest = AppManifest(
             name="object-agent",
@@ -127,10 +185,10 @@ class TestAgentAppInitialization:
 
     def test_manifest_not_found_raises_error(self):
         """Test that missing manifest file raises FileNotFoundError."""
-        with pytest.raises(FileNotFoundError, match="Manifest not found"):
+        with pytest.raises(FileNotFoundError, match=_MANIFEST_NOT_FOUND_RE):
             AgentApp(manifest="/nonexistent/path/app.yaml")
 
-    def test_debug_mode_enables_logging(self, mock_api_key):
+    def test_debug_mode_enables_logging(self):
         """Test that debug=True enables debug logging."""
         with patch("logging.basicConfig") as mock_logging:
             app = AgentApp(name="DebugAgent", debug=True)
@@ -141,41 +199,32 @@ class TestAgentAppInitialization:
 class TestAgentAppApiKeys:
     """Tests for API key retrieval."""
 
-    def test_get_api_key_claude(self):
-        """Test API key retrieval for Claude provider."""
-        os.environ["ANTHROPIC_API_KEY"] = "test-claude-key"
-        app = AgentApp(name="test", provider="claude")
-        assert app.config.api_key == "test-claude-key"
-        os.environ.pop("ANTHROPIC_API_KEY", None)
-
-    def test_get_api_key_openai(self):
-        """Test API key retrieval for OpenAI provider."""
-        os.environ["OPENAI_API_KEY"] = "test-openai-key"
-        app = AgentApp(name="test", provider="openai")
-        assert app.config.api_key == "test-openai-key"
-        os.environ.pop("OPENAI_API_KEY", None)
-
-    def test_get_api_key_gemini(self):
-        """Test API key retrieval for Gemini provider."""
-        os.environ["GOOGLE_API_KEY"] = "test-gemini-key"
-        app = AgentApp(name="test", provider="gemini")
-        assert app.config.api_key == "test-gemini-key"
-        os.environ.pop("GOOGLE_API_KEY", None)
-
-    def test_explicit_api_key_overrides_env(self):
+    @pytest.mark.parametrize(
+        ("provider", "env_var", "key"),
+        [
+            ("claude", "ANTHROPIC_API_KEY", "test-claude-key"),
+            ("openai", "OPENAI_API_KEY", "test-openai-key"),
+            ("gemini", "GOOGLE_API_KEY", "test-gemini-key"),
+        ],
+    )
+    def test_get_api_key(self, monkeypatch, provider, env_var, key):
+        """Test API key retrieval from each provider's environment variable."""
+        monkeypatch.setenv(env_var, key)
+        app = AgentApp(name="test", provider=provider)
+        assert app.config.api_key == key
+
+    def test_explicit_api_key_overrides_env(self, monkeypatch):
         """Test that explicitly provided API key overrides environment."""
-        os.environ["ANTHROPIC_API_KEY"] = "env-key"
+        monkeypatch.setenv("ANTHROPIC_API_KEY", "env-key")
         app = AgentApp(name="test", provider="claude", api_key="explicit-key")
         assert app.config.api_key == "explicit-key"
-        os.environ.pop("ANTHROPIC_API_KEY", None)
 
 
 class TestAgentAppToolRegistration:
     """Tests for tool registration via decorators."""
 
-    def test_tool_registration_basic(self, mock_api_key):
+    def test_tool_registration_basic(self, app):
         """Test basic tool registration via decorator."""
-        app = AgentApp(name="TestAgent")
 
         @app.tool(
             name="test_tool",
@@ -199,9 +248,8 @@ class TestAgentAppToolRegistration:
         assert tool.is_ui_tool is False
         assert tool.requires_confirmation is False
 
-    def test_tool_registration_with_ui_flag(self, mock_api_key):
+    def test_tool_registration_with_ui_flag(self, app):
         """Test tool registration with is_ui_tool flag."""
-        app = AgentApp(name="TestAgent")
 
         @app.tool(
             name="ui_tool",
@@ -215,9 +263,8 @@ class TestAgentAppToolRegistration:
         tool = app._tools[0]
         assert tool.is_ui_tool is True
 
-    def test_tool_registration_with_confirmation(self, mock_api_key):
+    def test_tool_registration_with_confirmation(self, app):
         """Test tool registration with requires_confirmation flag."""
-        app = AgentApp(name="TestAgent")
 
         @app.tool(
             name="dangerous_tool",
@@ -231,9 +278,23 @@ class TestAgentAppToolRegistration:
         tool = app._tools[0]
         assert tool.requires_confirmation is True
 
-    def test_ui_tool_decorator_shorthand(self, mock_api_key):
+    def test_tool_registration_cacheable(self, app):
+        """Test tool registration with cacheable flag."""
+
+        @app.tool(
+            name="pure_tool",
+            description="A pure tool",
+            parameters={"type": "object"},
+            cacheable=True,
+        )
+        def pure_tool():
+            return "Result"
+
+        tool = app._tools[0]
+        assert tool.cacheable is True
+
+    def test_ui_tool_decorator_shorthand(self, app):
         """Test ui_tool decorator as shorthand."""
-        app = AgentApp(name="TestAgent")
 
         @app.ui_tool(
             name="shorthand_ui",
@@ -247,9 +308,8 @@ class TestAgentAppToolRegistration:
         assert tool.name == "shorthand_ui"
         assert tool.is_ui_tool is True
 
-    def test_multiple_tool_registration(self, mock_api_key):
+    def test_multiple_tool_registration(self, app):
         """Test registering multiple tools."""
-        app = AgentApp(name="TestAgent")
 
         @app.tool("tool1", "First tool", {"type": "object"})
         def tool1():
@@ -269,9 +329,8 @@ class TestAgentAppToolRegistration:
         assert app._tools[2].name == "tool3"
         assert app._tools[2].is_ui_tool is True
 
-    def test_tool_decorator_returns_original_function(self, mock_api_key):
+    def test_tool_decorator_returns_original_function(self, app):
         """Test that decorator returns the original function."""
-        app = AgentApp(name="TestAgent")
 
         @app.tool("test", "Test", {"type": "object"})
         def original_func(x: int) -> int:
@@ -286,100 +345,82 @@ class TestAgentAppChat:
     """Tests for chat functionality."""
 
     @pytest.mark.asyncio
-    async def test_chat_creates_core_on_first_call(self, mock_api_key):
+    async def test_chat_creates_core_on_first_call(self, app, patched_core):
         """Test that chat() creates AgentCore on first call."""
-        app = AgentApp(name="TestAgent")
+        MockCore, mock_core = patched_core
         assert app._core is None
 
-        # Mock the core and its process_message method
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
-
-            # Mock process_message to yield chunks
-            async def mock_process(message):
-                yield MagicMock(content="Hello", is_complete=False)
-                yield MagicMock(content=" World", is_complete=True)
+        # Mock process_message to yield chunks
+        async def mock_process(message):
+            yield _Chunk("Hello", False)
+            yield _Chunk(" World", True)
 
-            mock_core.process_message = mock_process
+        mock_core.process_message = mock_process
 
-            response = await app.chat("Hi")
+        response = await app.chat("Hi")
 
-            assert app._core is not None
-            MockCore.assert_called_once()
+        assert app._core is not None
+        MockCore.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_chat_reuses_core_on_subsequent_calls(self, mock_api_key):
+    async def test_chat_reuses_core_on_subsequent_calls(self, app, patched_core):
         """Test that chat() reuses the same core for subsequent calls."""
-        app = AgentApp(name="TestAgent")
+        MockCore, mock_core = patched_core
 
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
+        async def mock_process(message):
+            yield _Chunk("Response", True)
 
-            async def mock_process(message):
-                yield MagicMock(content="Response", is_complete=True)
+        mock_core.process_message = mock_process
 
-            mock_core.process_message = mock_process
+        await app.chat("Message 1")
+        await app.chat("Message 2")
 
-            await app.chat("Message 1")
-            await app.chat("Message 2")
-
-            # Core should only be created once
-            MockCore.assert_called_once()
+        # Core should only be created once
+        MockCore.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_chat_registers_tools(self, mock_api_key):
+    async def test_chat_registers_tools(self, app, patched_core):
         """Test that chat() registers tools with the core."""
-        app = AgentApp(name="TestAgent")
+        _, mock_core = patched_core
 
         @app.tool("test_tool", "Test", {"type": "object"})
         def test_tool():
             return "result"
 
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
-            mock_core.register_tool = MagicMock()
-
-            async def mock_process(message):
-                yield MagicMock(content="Response", is_complete=True)
+        async def mock_process(message):
+            yield _Chunk("Response", True)
 
-            mock_core.process_message = mock_process
+        mock_core.process_message = mock_process
 
-            await app.chat("Test message")
+        await app.chat("Test message")
 
-            # Verify tool was registered
-            mock_core.register_tool.assert_called_once()
-            registered_tool = mock_core.register_tool.call_args[0][0]
-            assert registered_tool.name == "test_tool"
+        # Verify tool was registered
+        mock_core.register_tool.assert_called_once()
+        registered_tool = mock_core.register_tool.call_args[0][0]
+        assert registered_tool.name == "test_tool"
 
     @pytest.mark.asyncio
-    async def test_chat_accumulates_response(self, mock_api_key):
+    async def test_chat_accumulates_response(self, app, patched_core):
         """Test that chat() correctly accumulates streaming response."""
-        app = AgentApp(name="TestAgent")
-
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
+        _, mock_core = patched_core
 
-            async def mock_process(message):
-                yield MagicMock(content="Hello", is_complete=False)
-                yield MagicMock(content=" ", is_complete=False)
-                yield MagicMock(content="World", is_complete=False)
-                yield MagicMock(content="!", is_complete=True)
+        async def mock_process(message):
+            yield _Chunk("Hello", False)
+            yield _Chunk(" ", False)
+            yield _Chunk("World", False)
+            yield _Chunk("!", True)
 
-            mock_core.process_message = mock_process
+        mock_core.process_message = mock_process
 
-            response = await app.chat("Hi")
+        response = await app.chat("Hi")
 
-            assert response == "Hello World!"
+        assert response == "Hello World!"
 
 
 class TestCreateApp:
     """Tests for create_app convenience function."""
 
-    def test_create_app_without_manifest(self, mock_api_key):
+    def test_create_app_without_manifest(self):
         """Test create_app without manifest."""
         app = create_app(name="TestApp")
         assert isinstance(app, AgentApp)
@@ -391,7 +432,7 @@ class TestCreateApp:
         assert isinstance(app, AgentApp)
         assert app.manifest.name == "test-agent"
 
-    def test_create_app_with_kwargs(self, mock_api_key):
+    def test_create_app_with_kwargs(self):
         """Test create_app passes kwargs to AgentApp."""
         app = create_app(
             name="TestApp",
@@ -406,37 +447,33 @@ class TestQuickChat:
     """Tests for quick_chat convenience function."""
 
     @pytest.mark.asyncio
-    async def test_quick_chat_basic(self, mock_api_key):
+    async def test_quick_chat_basic(self, patched_core):
         """Test quick_chat creates app and returns response."""
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
+        _, mock_core = patched_core
 
-            async def mock_process(message):
-                yield MagicMock(content="Quick response", is_complete=True)
+        async def mock_process(message):
+            yield _Chunk("Quick response", True)
 
-            mock_core.process_message = mock_process
+        mock_core.process_message = mock_process
 
-            response = await quick_chat("Test message")
-            assert response == "Quick response"
+        response = await quick_chat("Test message")
+        assert response == "Quick response"
 
     @pytest.mark.asyncio
-    async def test_quick_chat_with_parameters(self, mock_api_key):
+    async def test_quick_chat_with_parameters(self, patched_core):
         """Test quick_chat accepts provider, model, and system_prompt."""
-        with patch("agentui.app.AgentCore") as MockCore:
-            mock_core = MagicMock()
-            MockCore.return_value = mock_core
+        _, mock_core = patched_core
 
-            async def mock_process(message):
-                yield MagicMock(content="Response", is_complete=True)
+        async def mock_process(message):
+            yield _Chunk("Response", True)
 
-            mock_core.process_message = mock_process
+        mock_core.process_message = mock_process
 
-            response = await quick_chat(
-                "Test",
-                provider="openai",
-                model="gpt-4",
-                system_prompt="Custom prompt",
-            )
+        response = await quick_chat(
+            "Test",
+            provider="openai",
+            model="gpt-4",
+            system_prompt="Custom prompt",
+        )
 
-            assert response == "Response"
+        assert response == "Response"
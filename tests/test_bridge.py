@@ -4,8 +4,11 @@ Tests for the bridge module.
 
 import pytest
 import asyncio
-from agentui.bridge import CLIBridge, TUIConfig, create_bridge
-from agentui.protocol import Message
+from unittest.mock import AsyncMock
+from agentui.bridge import CLIBridge, TUIBridge, TUIConfig, create_bridge
+from agentui.exceptions import ValidationError
+from agentui.primitives import UICode, UIConfirm, UIText
+from agentui.protocol import Message, MessageType
 
 
 @pytest.fixture
@@ -82,6 +85,87 @@ class TestCLIBridge:
         await cli_bridge.stop()
 
 
+class TestTUIBridgeFlush:
+    """Tests for TUIBridge.flush."""
+
+    @pytest.mark.asyncio
+    async def test_flush_waits_for_ack_behind_queued_sends(self):
+        """Test the flush marker is queued after earlier sends and resolves on ack."""
+        bridge = TUIBridge()
+        bridge._running = True
+
+        await bridge.send_text("Hello")
+        flush = asyncio.create_task(bridge.flush())
+
+        sent_text = await bridge._outgoing_queue.get()
+        marker = await bridge._outgoing_queue.get()
+        assert sent_text.type == MessageType.TEXT.value
+        assert marker.type == MessageType.FLUSH.value
+        assert not flush.done()
+
+        await bridge._route_message(Message(type=MessageType.FLUSH_ACK.value, id=marker.id))
+        await asyncio.wait_for(flush, timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_cli_flush_returns_immediately(self, cli_bridge):
+        """Test CLI bridge flush is a no-op."""
+        await cli_bridge.flush()
+
+
+class TestSendBatch:
+    """Tests for send_batch."""
+
+    @pytest.mark.asyncio
+    async def test_tui_batch_is_one_queued_write(self):
+        """Test TUIBridge queues the whole batch as one item, in order."""
+        bridge = TUIBridge()
+        bridge._running = True
+
+        await bridge.send_batch([UIText("Hi"), UICode("x = 1", language="python")])
+
+        assert bridge._outgoing_queue.qsize() == 1
+        batch = bridge._outgoing_queue.get_nowait()
+        assert [m.type for m in batch] == [MessageType.TEXT.value, MessageType.CODE.value]
+        assert batch[1].payload["language"] == "python"
+
+    @pytest.mark.asyncio
+    async def test_tui_batch_rejects_blocking_primitives(self):
+        """Test request primitives can't be batched."""
+        bridge = TUIBridge()
+        bridge._running = True
+
+        with pytest.raises(ValidationError):
+            await bridge.send_batch([UIConfirm("Sure?")])
+
+    @pytest.mark.asyncio
+    async def test_tui_batch_accepts_primitive_subclasses(self):
+        """Test TUIBridge batches subclasses like the isinstance-based default."""
+
+        class Note(UIText):
+            pass
+
+        bridge = TUIBridge()
+        bridge._running = True
+
+        await bridge.send_batch([Note("Hi")])
+
+        batch = bridge._outgoing_queue.get_nowait()
+        assert [m.type for m in batch] == [MessageType.TEXT.value]
+
+    @pytest.mark.asyncio
+    async def test_cli_batch_sends_each_primitive(self, cli_bridge):
+        """Test the default send_batch falls back to the send_* methods."""
+        cli_bridge.send_text = AsyncMock()
+        cli_bridge.send_code = AsyncMock()
+
+        await cli_bridge.send_batch(
+            [UIText("Batched", done=True), UICode("x = 1", language="python")]
+        )
+
+        cli_bridge.send_text.assert_awaited_once_with("Batched", done=True)
+        cli_bridge.send_code.assert_awaited_once_with("x = 1", "python", None)
+
+
 class TestCreateBridge:
     """Tests for create_bridge function."""
     
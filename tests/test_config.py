@@ -1,14 +1,40 @@
 """Tests for configuration management."""
 
-import os
-import tempfile
+import json
 from pathlib import Path
 
 import pytest
-import yaml
 
+import agentui.config
+import agentui.types
 from agentui.config import AgentConfig, ProviderType, TUIConfig
 
+_CFG_DATA = {
+    "provider": "openai",
+    "model": "gpt-4",
+    "max_tokens": 8192,
+    "temperature": 0.5,
+    "system_prompt": "Custom prompt",
+    "theme": "charm-dark",
+}
+
+# File contents are constant, so they are kept pre-serialized
+_CFG_JSON = json.dumps(_CFG_DATA)
+
+_CFG_YAML = """\
+provider: openai
+model: gpt-4
+max_tokens: 8192
+temperature: 0.5
+system_prompt: Custom prompt
+theme: charm-dark
+"""
+
+_PARTIAL_CFG_YAML = """\
+model: gpt-4
+temperature: 0.3
+"""
+
 
 class TestAgentConfig:
     """Test AgentConfig class."""
@@ -22,6 +48,7 @@ class TestAgentConfig:
         assert config.api_key is None
         assert config.max_tokens == 4096
         assert config.temperature == 0.7
+        assert config.prompt_cache is True
         assert config.system_prompt == "You are a helpful AI assistant."
         assert config.max_tool_iterations == 10
         assert config.theme == "catppuccin-mocha"
@@ -86,62 +113,47 @@ class TestAgentConfig:
         # Should fall back to default CLAUDE provider
         assert config.provider == ProviderType.CLAUDE
 
-    def test_from_file(self) -> None:
-        """Test loading config from YAML file."""
-        config_data = {
-            "provider": "openai",
-            "model": "gpt-4",
-            "max_tokens": 8192,
-            "temperature": 0.5,
-            "system_prompt": "Custom prompt",
-            "theme": "charm-dark",
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = Path(f.name)
-
-        try:
-            config = AgentConfig.from_file(temp_path)
-
-            assert config.provider == "openai"
-            assert config.model == "gpt-4"
-            assert config.max_tokens == 8192
-            assert config.temperature == 0.5
-            assert config.system_prompt == "Custom prompt"
-            assert config.theme == "charm-dark"
-        finally:
-            temp_path.unlink()
+    @pytest.mark.parametrize(
+        ("filename", "content"),
+        [
+            ("cfg.json", _CFG_JSON),  # JSON is valid YAML, so it loads the same way
+            ("cfg.yaml", _CFG_YAML),
+        ],
+    )
+    def test_from_file(self, tmp_path: Path, filename: str, content: str) -> None:
+        """Test loading config from a YAML or JSON file."""
+        config_path = tmp_path / filename
+        config_path.write_text(content)
+
+        config = AgentConfig.from_file(config_path)
+
+        assert config.provider == "openai"
+        assert config.model == "gpt-4"
+        assert config.max_tokens == 8192
+        assert config.temperature == 0.5
+        assert config.system_prompt == "Custom prompt"
+        assert config.theme == "charm-dark"
 
     def test_from_file_not_found(self) -> None:
         """Test loading config from non-existent file raises error."""
         with pytest.raises(FileNotFoundError):
             AgentConfig.from_file(Path("/nonexistent/config.yaml"))
 
-    def test_from_file_partial_config(self) -> None:
+    def test_from_file_partial_config(self, tmp_path: Path) -> None:
         """Test loading config from file with partial values uses defaults."""
-        config_data = {
-            "model": "gpt-4",
-            "temperature": 0.3,
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-            yaml.dump(config_data, f)
-            temp_path = Path(f.name)
+        config_path = tmp_path / "cfg.yaml"
+        config_path.write_text(_PARTIAL_CFG_YAML)
 
-        try:
-            config = AgentConfig.from_file(temp_path)
+        config = AgentConfig.from_file(config_path)
 
-            # Specified values
-            assert config.model == "gpt-4"
-            assert config.temperature == 0.3
+        # Specified values
+        assert config.model == "gpt-4"
+        assert config.temperature == 0.3
 
-            # Default values
-            assert config.provider == ProviderType.CLAUDE
-            assert config.max_tokens == 4096
-            assert config.system_prompt == "You are a helpful AI assistant."
-        finally:
-            temp_path.unlink()
+        # Default values
+        assert config.provider == ProviderType.CLAUDE
+        assert config.max_tokens == 4096
+        assert config.system_prompt == "You are a helpful AI assistant."
 
 
 class TestTUIConfig:
@@ -203,25 +215,21 @@ class TestTUIConfig:
         assert config.tui_path == "/custom/tui"
         assert config.debug is True
 
-    def test_from_env_debug_values(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("", False),  # Empty string = False
+            ("true", True),  # Any non-empty string = True
+            ("false", True),  # bool("false") is True
+            ("0", True),  # bool("0") is True
+        ],
+    )
+    def test_from_env_debug_values(
+        self, monkeypatch: pytest.MonkeyPatch, value: str, expected: bool
+    ) -> None:
         """Test various debug environment variable values."""
-        # Empty string = False
-        monkeypatch.setenv("AGENTUI_DEBUG", "")
-        config = TUIConfig.from_env()
-        assert config.debug is False
-
-        # Any non-empty string = True
-        monkeypatch.setenv("AGENTUI_DEBUG", "true")
-        config = TUIConfig.from_env()
-        assert config.debug is True
-
-        monkeypatch.setenv("AGENTUI_DEBUG", "false")
-        config = TUIConfig.from_env()
-        assert config.debug is True  # bool("false") is True
-
-        monkeypatch.setenv("AGENTUI_DEBUG", "0")
-        config = TUIConfig.from_env()
-        assert config.debug is True  # bool("0") is True
+        monkeypatch.setenv("AGENTUI_DEBUG", value)
+        assert TUIConfig.from_env().debug is expected
 
 
 class TestProviderType:
@@ -250,27 +258,18 @@ class TestProviderType:
 class TestBackwardCompatibility:
     """Test backward compatibility with types.py re-exports."""
 
-    def test_import_from_types(self) -> None:
-        """Test that configs can still be imported from types module."""
-        from agentui.types import AgentConfig as TypesAgentConfig
-        from agentui.types import ProviderType as TypesProviderType
-        from agentui.types import TUIConfig as TypesTUIConfig
-
-        # Verify they're the same classes
-        assert TypesAgentConfig is AgentConfig
-        assert TypesProviderType is ProviderType
-        assert TypesTUIConfig is TUIConfig
-
-    def test_import_from_config(self) -> None:
-        """Test that configs can be imported from new config module."""
-        from agentui.config import AgentConfig as ConfigAgentConfig
-        from agentui.config import ProviderType as ConfigProviderType
-        from agentui.config import TUIConfig as ConfigTUIConfig
-
-        # Verify they're the same classes
-        assert ConfigAgentConfig is AgentConfig
-        assert ConfigProviderType is ProviderType
-        assert ConfigTUIConfig is TUIConfig
+    @pytest.mark.parametrize(
+        ("reexported", "cls"),
+        [
+            (agentui.types.AgentConfig, AgentConfig),
+            (agentui.types.ProviderType, ProviderType),
+            (agentui.types.TUIConfig, TUIConfig),
+        ],
+    )
+    def test_reexported_classes_are_identical(self, reexported: type, cls: type) -> None:
+        """Test that configs imported from types are the config module's classes."""
+        assert reexported is cls
+        assert getattr(agentui.config, cls.__name__) is cls
 
     def test_cross_module_compatibility(self) -> None:
         """Test that instances work across module imports."""
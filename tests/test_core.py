@@ -128,6 +128,26 @@ class TestToolRegistration:
         assert "simple_tool" in tool_names
         assert "display_table" in tool_names
 
+    def test_get_tool_schemas_cached_until_registration(self):
+        """Test tool schemas are reused until a new tool is registered."""
+        core = AgentCore()
+
+        schemas = core.get_tool_schemas()
+        assert core.get_tool_schemas() is schemas
+
+        core.register_tool(
+            ToolDefinition(
+                name="late_tool",
+                description="Registered after first use",
+                parameters={"type": "object", "properties": {}},
+                handler=lambda: "result",
+            )
+        )
+
+        updated = core.get_tool_schemas()
+        assert updated is not schemas
+        assert "late_tool" in [s["name"] for s in updated]
+
 
 class TestToolExecution:
     """Test tool execution."""
@@ -258,6 +278,34 @@ class TestToolExecution:
         assert result.error is not None
         assert "cancelled by user" in result.error
 
+    @pytest.mark.asyncio
+    async def test_cacheable_tool_reuses_result(self, mock_bridge):
+        """Test a cacheable tool runs once per distinct set of arguments."""
+        core = AgentCore(bridge=mock_bridge)
+        calls = []
+
+        def lookup(key: str):
+            calls.append(key)
+            return key.upper()
+
+        tool = ToolDefinition(
+            name="lookup",
+            description="Pure lookup",
+            parameters={"type": "object", "properties": {"key": {"type": "string"}}},
+            handler=lookup,
+            cacheable=True,
+        )
+
+        core.register_tool(tool)
+        first = await core.execute_tool("lookup", "id-1", {"key": "a"})
+        second = await core.execute_tool("lookup", "id-2", {"key": "a"})
+        other = await core.execute_tool("lookup", "id-3", {"key": "b"})
+
+        assert calls == ["a", "b"]
+        assert second.result == first.result == "A"
+        assert second.tool_id == "id-2"
+        assert other.result == "B"
+
 
 class TestComponentSelection:
     """Test automatic component selection."""
@@ -728,6 +776,7 @@ class TestProviderManagement:
                 model="claude-3-sonnet-20240229",
                 api_key="test-key",
                 max_tokens=4096,
+                prompt_cache=True,
             )
             assert provider == mock_instance
 
@@ -894,6 +943,44 @@ class TestStreamingAndToolFlow:
         assert tool_calls == []
         assert should_return is False
 
+    @pytest.mark.asyncio
+    async def test_stream_provider_response_accumulates_cache_tokens(self):
+        """Test message_end cache usage is summed into the agent state."""
+        core = AgentCore()
+
+        async def mock_stream(messages, system, tools):
+            yield {"type": "text", "content": "Hi"}
+            yield {
+                "type": "message_end",
+                "content": "",
+                "input_tokens": 10,
+                "output_tokens": 5,
+                "cache_creation_input_tokens": 100,
+                "cache_read_input_tokens": 0,
+            }
+
+        async def mock_cached_stream(messages, system, tools):
+            yield {"type": "text", "content": "Hi again"}
+            yield {
+                "type": "message_end",
+                "content": "",
+                "input_tokens": 12,
+                "output_tokens": 6,
+                "cache_creation_input_tokens": 0,
+                "cache_read_input_tokens": 100,
+            }
+
+        mock_provider = MagicMock()
+        mock_provider.stream_message = mock_stream
+        await core._stream_provider_response(mock_provider)
+        mock_provider.stream_message = mock_cached_stream
+        await core._stream_provider_response(mock_provider)
+
+        assert core.state.total_input_tokens == 22
+        assert core.state.total_output_tokens == 11
+        assert core.state.total_cache_creation_tokens == 100
+        assert core.state.total_cache_read_tokens == 100
+
     @pytest.mark.asyncio
     async def test_stream_provider_response_with_tool_calls(self):
         """Test streaming response with tool calls."""
@@ -966,6 +1053,94 @@ class TestStreamingAndToolFlow:
         assert last_message.role == "user"
         assert "ui_tool" in last_message.content
 
+    @pytest.mark.asyncio
+    async def test_execute_and_record_tools_runs_calls_concurrently(self):
+        """Test tool calls from one response overlap and keep their order."""
+        core = AgentCore()
+        started = []
+        both_started = asyncio.Event()
+
+        async def slow_tool(label: str):
+            started.append(label)
+            if len(started) == 2:
+                both_started.set()
+            await asyncio.wait_for(both_started.wait(), timeout=1)
+            return label
+
+        core.register_tool(ToolDefinition(
+            name="slow_tool",
+            description="Slow tool",
+            parameters={"type": "object", "properties": {}},
+            handler=slow_tool,
+            cacheable=True,
+        ))
+
+        tool_calls = [
+            {"name": "slow_tool", "id": "t1", "input": {"label": "first"}},
+            {"name": "slow_tool", "id": "t2", "input": {"label": "second"}},
+        ]
+
+        await core._execute_and_record_tools(tool_calls)
+
+        tool_results = [m.tool_results[0] for m in core.state.messages[-2:]]
+        assert [r["tool_use_id"] for r in tool_results] == ["t1", "t2"]
+        assert [r["content"] for r in tool_results] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_execute_and_record_tools_runs_side_effecting_calls_in_order(self):
+        """Test tools not marked pure run one at a time, in request order."""
+        core = AgentCore()
+        events = []
+
+        async def step(label: str):
+            events.append(f"start {label}")
+            await asyncio.sleep(0)
+            events.append(f"end {label}")
+            return label
+
+        core.register_tool(ToolDefinition(
+            name="step",
+            description="Side-effecting tool",
+            parameters={"type": "object", "properties": {}},
+            handler=step
+        ))
+
+        tool_calls = [
+            {"name": "step", "id": "t1", "input": {"label": "first"}},
+            {"name": "step", "id": "t2", "input": {"label": "second"}},
+        ]
+
+        await core._execute_and_record_tools(tool_calls)
+
+        assert events == ["start first", "end first", "start second", "end second"]
+
+    @pytest.mark.asyncio
+    async def test_execute_and_record_tools_never_overlaps_modals(self, mock_bridge):
+        """Test two display_confirm calls open their modals one after the other."""
+        core = AgentCore(bridge=mock_bridge)
+        open_modals = 0
+        max_open = 0
+
+        async def request_confirm(**kwargs):
+            nonlocal open_modals, max_open
+            open_modals += 1
+            max_open = max(max_open, open_modals)
+            await asyncio.sleep(0.01)
+            open_modals -= 1
+            return True
+
+        mock_bridge.request_confirm = AsyncMock(side_effect=request_confirm)
+
+        tool_calls = [
+            {"name": "display_confirm", "id": "c1", "input": {"message": "First?"}},
+            {"name": "display_confirm", "id": "c2", "input": {"message": "Second?"}},
+        ]
+
+        await core._execute_and_record_tools(tool_calls)
+
+        assert mock_bridge.request_confirm.await_count == 2
+        assert max_open == 1
+
     @pytest.mark.asyncio
     async def test_stream_provider_response_with_cancel(self):
         """Test streaming response with cancellation."""
@@ -66,6 +66,14 @@ class TestPhase1Integration:
         assert "rows" in table_schema["input_schema"]["properties"]
         assert "columns" in table_schema["input_schema"]["required"]
 
+    def test_display_tool_schemas_built_once(self):
+        """Test display_* schemas are shared across calls without sharing the list."""
+        first = ComponentCatalog.get_tool_schemas()
+        second = ComponentCatalog.get_tool_schemas()
+
+        assert first is not second
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
     def test_catalog_contains_all_primitives(self):
         """Test that catalog documents all UI primitives."""
         catalog = ComponentCatalog.get_catalog_prompt()
@@ -4,6 +4,7 @@ Tests for the protocol module.
 
 import json
 import pytest
+from agentui import protocol
 from agentui.protocol import (
     Message,
     MessageType,
@@ -123,3 +124,55 @@ def test_progress_payload():
     assert payload["message"] == "Processing..."
     assert payload["percent"] == 50.0
     assert len(payload["steps"]) == 2
+
+
+def test_message_json_roundtrip():
+    """Test that serialized messages round-trip through from_json."""
+    msg = create_message(
+        MessageType.TABLE,
+        table_payload(["Name", "Score"], [["Alice", "95"], ["Bob", "87"]], title="Résumé"),
+    )
+
+    restored = Message.from_json(msg.to_json())
+
+    assert restored.type == msg.type
+    assert restored.payload == msg.payload
+
+
+def _to_json_with(monkeypatch, use_orjson: bool, msg: Message) -> str:
+    """Serialize a message with the orjson or stdlib encoder forced on."""
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(protocol, "_HAS_ORJSON", use_orjson)
+    return msg.to_json()
+
+
+@pytest.mark.parametrize("use_orjson", [False, True], ids=["json", "orjson"])
+def test_message_json_roundtrip_per_encoder(monkeypatch, use_orjson):
+    """Test that both encoders round-trip a message through from_json."""
+    msg = create_message(
+        MessageType.TABLE,
+        table_payload(["Name", "Score"], [["Alice", "95"], ["Bob", "87"]], title="Résumé"),
+    )
+
+    restored = Message.from_json(_to_json_with(monkeypatch, use_orjson, msg))
+
+    assert restored.type == msg.type
+    assert restored.payload == msg.payload
+
+
+def test_encoders_produce_identical_output(monkeypatch):
+    """Test the encoders agree on separators, non-ASCII text and non-str keys."""
+    msg = create_message(
+        MessageType.TABLE,
+        {
+            "title": "Résumé",
+            "rows": [["Alice", 95, 1.5, None, True]],
+            "by_index": {1: "one", 2.5: "two and a half", None: "none"},
+        },
+    )
+
+    stdlib_line = _to_json_with(monkeypatch, False, msg)
+    orjson_line = _to_json_with(monkeypatch, True, msg)
+
+    assert orjson_line == stdlib_line
@@ -23,6 +23,7 @@ class TestClaudeProviderInitialization:
             assert provider.model == ClaudeProvider.DEFAULT_MODEL
             assert provider.api_key == "test-key"
             assert provider.max_tokens == 4096
+            assert provider.prompt_cache is True
             assert provider._client is None
 
     def test_init_with_custom_model(self):
@@ -180,7 +181,7 @@ class TestClaudeProviderMessageConversion:
     def test_convert_tools(self):
         """Test tool definition conversion."""
         with patch.dict("os.environ", {"ANTHROPIC_API_KEY": "test-key"}):
-            provider = ClaudeProvider()
+            provider = ClaudeProvider(prompt_cache=False)
 
             tools = [
                 {
@@ -262,7 +263,7 @@ class TestClaudeProviderStreaming:
             mock_anthropic_module.Anthropic.return_value = mock_client
 
             with patch.dict("sys.modules", {"anthropic": mock_anthropic_module}):
-                provider = ClaudeProvider()
+                provider = ClaudeProvider(prompt_cache=False)
 
                 messages = [{"role": "user", "content": "Test"}]
 
@@ -363,6 +364,52 @@ class TestClaudeProviderStreaming:
                 assert end_chunks[0]["input_tokens"] == 100
                 assert end_chunks[0]["output_tokens"] == 50
 
+    def test_build_request_with_prompt_cache(self):
+        """Test system prompt is sent as a cached text block when enabled."""
+        provider = ClaudeProvider(api_key="test-key", prompt_cache=True)
+
+        request = provider._build_request(
+            [{"role": "user", "content": "Test"}], "You are helpful", None
+        )
+
+        assert request["system"] == [
+            {
+                "type": "text",
+                "text": "You are helpful",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+
+    def test_build_request_caches_last_tool(self):
+        """Test only the final tool carries a cache breakpoint when enabled."""
+        provider = ClaudeProvider(api_key="test-key", prompt_cache=True)
+        tools = [
+            {"name": name, "description": name, "input_schema": {"type": "object"}}
+            for name in ("first", "second")
+        ]
+
+        request = provider._build_request([], None, tools)
+
+        assert [tool["name"] for tool in request["tools"]] == ["first", "second"]
+        assert "cache_control" not in request["tools"][0]
+        assert request["tools"][1]["cache_control"] == {"type": "ephemeral"}
+
+    def test_handle_message_delta_cache_usage(self):
+        """Test prompt cache token counts are reported in message_end."""
+        provider = ClaudeProvider(api_key="test-key")
+        event = Mock()
+        event.usage = Mock(
+            input_tokens=10,
+            output_tokens=5,
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=2048,
+        )
+
+        chunk = provider._handle_message_delta(event)
+
+        assert chunk["cache_creation_input_tokens"] == 0
+        assert chunk["cache_read_input_tokens"] == 2048
+
 
 class TestClaudeProviderEventHandling:
     """Test Claude provider event handling."""